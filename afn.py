@@ -0,0 +1,198 @@
+# Autômato finito não determinístico (com transições vazias) e sua determinização.
+# A construção de subconjuntos pode ser feita de uma vez (determinizar) ou sob demanda
+# (DeterminizacaoPreguicosa), materializando só os estados do AFD que a entrada alcança.
+from collections import deque
+
+from main import Afd, LeitorJFLAP
+
+# Símbolos tratados como transição vazia: <read/> do JFLAP (None) e a cadeia vazia
+EPSILON = (None, "")
+
+
+class Afn:
+    def __init__(self, estados, alfabeto, estado_inicial, estados_finais):
+        self.estados = estados
+        self.alfabeto = [simbolo for simbolo in alfabeto if simbolo not in EPSILON]
+        self.transicoes = {}  # (estado, símbolo) -> conjunto de destinos
+        self.estado_inicial = estado_inicial
+        self.estados_finais = estados_finais
+        self._fechos = {}
+        self._preguicosa = None
+
+    # Lê arquivos xml do jflap mantendo todos os destinos de cada (estado, símbolo)
+    @classmethod
+    def carregarAFN(cls, nome_arquivo):
+        leitor = LeitorAfn.ler(nome_arquivo)
+        leitor.tabelaTransicoes()
+
+        afn = cls(leitor.estados, list(leitor.alfabeto), leitor.estado_inicial, leitor.estados_finais)
+        afn.transicoes = leitor.transicoes
+        return afn
+
+    # Qualquer Afd também é um Afn
+    @classmethod
+    def deAfd(cls, afd):
+        afn = cls(afd.estados, afd.alfabeto, afd.estado_inicial, afd.estados_finais)
+        for chave, destino in afd.func_transicao.items():
+            if destino is not None:
+                afn.adicionarTransicao(*chave, destino)
+        return afn
+
+    def adicionarTransicao(self, origem, simbolo, destino):
+        self.transicoes.setdefault((origem, simbolo), set()).add(destino)
+        self._fechos = {}
+        self._preguicosa = None
+
+    # Fecho-ε de um único estado (busca iterativa, guardada em cache)
+    def fechoEstado(self, estado):
+        fecho = self._fechos.get(estado)
+        if fecho is None:
+            visitados = {estado}
+            pilha = [estado]
+            while pilha:
+                atual = pilha.pop()
+                for vazio in EPSILON:
+                    for proximo in self.transicoes.get((atual, vazio), ()):
+                        if proximo not in visitados:
+                            visitados.add(proximo)
+                            pilha.append(proximo)
+            fecho = self._fechos[estado] = frozenset(visitados)
+        return fecho
+
+    # Fecho-ε de um conjunto de estados
+    def fechoEpsilon(self, estados):
+        fecho = set()
+        for estado in estados:
+            fecho |= self.fechoEstado(estado)
+        return frozenset(fecho)
+
+    # Conjunto alcançado a partir de "conjunto" lendo o símbolo (já com o fecho-ε)
+    def mover(self, conjunto, simbolo):
+        destinos = set()
+        for estado in conjunto:
+            destinos.update(self.transicoes.get((estado, simbolo), ()))
+        return self.fechoEpsilon(destinos)
+
+    def conjuntoInicial(self):
+        if self.estado_inicial is None:
+            return frozenset()
+        return self.fechoEstado(self.estado_inicial)
+
+    # Construção de subconjuntos completa; cada estado do AFD é a tupla dos estados do AFN
+    # (na ordem de "estados"). O conjunto vazio não vira estado: falta de transição já o representa.
+    def determinizar(self):
+        ordem = {estado: i for i, estado in enumerate(self.estados)}
+        finais = set(self.estados_finais)
+
+        def nome(conjunto):
+            return tuple(sorted(conjunto, key=lambda e: ordem.get(e, len(ordem))))
+
+        inicial = self.conjuntoInicial()
+        vistos = {inicial}
+        fila = deque([inicial])
+        estados = []
+        estados_finais = []
+        func_transicao = {}
+
+        while fila:
+            conjunto = fila.popleft()
+            estados.append(nome(conjunto))
+            if conjunto & finais:
+                estados_finais.append(nome(conjunto))
+
+            for simbolo in self.alfabeto:
+                proximo = self.mover(conjunto, simbolo)
+                if not proximo:
+                    continue
+                func_transicao[(nome(conjunto), simbolo)] = nome(proximo)
+                if proximo not in vistos:
+                    vistos.add(proximo)
+                    fila.append(proximo)
+
+        afd = Afd(estados, list(self.alfabeto), nome(inicial), estados_finais)
+        afd.func_transicao = func_transicao
+        return afd
+
+    # Determiniza e minimiza
+    def paraAfdMinimo(self):
+        return self.determinizar().minimizar()
+
+    def determinizacaoPreguicosa(self, limite_estados=10_000):
+        return DeterminizacaoPreguicosa(self, limite_estados)
+
+    # Reconhece usando um AFD preguiçoso guardado entre as chamadas
+    def accepts(self, cadeia):
+        if self._preguicosa is None:
+            self._preguicosa = self.determinizacaoPreguicosa()
+        return self._preguicosa.accepts(cadeia)
+
+
+# Leitor do JFLAP que guarda todos os destinos em vez de sobrescrever
+class LeitorAfn(LeitorJFLAP):
+    def __init__(self):
+        super().__init__()
+        self.transicoes = {}
+
+    def adicionarTransicao(self, origem, simbolo, destino):
+        self.transicoes.setdefault((origem, simbolo), set()).add(destino)
+
+
+# AFD materializado sob demanda. Cada estado descoberto ganha um id e suas transições são
+# calculadas na primeira vez em que são usadas; quando o número de estados passa do limite,
+# o cache inteiro é descartado e reconstruído a partir do estado atual.
+class DeterminizacaoPreguicosa:
+    def __init__(self, afn, limite_estados=10_000):
+        self.afn = afn
+        self.limite_estados = limite_estados
+        self.finais_afn = frozenset(afn.estados_finais)
+        self.descartes = 0
+        self.limpar()
+
+    def limpar(self):
+        self.ids = {}
+        self.conjuntos = []
+        self.transicoes = []  # por id: símbolo -> id do próximo estado
+        self.finais = []
+
+    def materializar(self, conjunto):
+        i = self.ids.get(conjunto)
+        if i is None:
+            i = self.ids[conjunto] = len(self.conjuntos)
+            self.conjuntos.append(conjunto)
+            self.transicoes.append({})
+            self.finais.append(bool(conjunto & self.finais_afn))
+        return i
+
+    def inicial(self):
+        return self.materializar(self.afn.conjuntoInicial())
+
+    # Id do estado seguinte, calculando e guardando a transição se ainda não existe
+    def proximo(self, i, simbolo):
+        j = self.transicoes[i].get(simbolo)
+        if j is None:
+            conjunto = self.conjuntos[i]
+            destino = self.afn.mover(conjunto, simbolo)
+            if len(self.conjuntos) >= self.limite_estados:
+                self.descartes += 1
+                self.limpar()
+                i = self.materializar(conjunto)
+            j = self.transicoes[i][simbolo] = self.materializar(destino)
+        return j
+
+    # Id do estado alcançado após ler a cadeia a partir de "inicio"
+    def executar(self, cadeia, inicio=None):
+        estado = self.inicial() if inicio is None else inicio
+        for simbolo in cadeia:
+            proximo = self.transicoes[estado].get(simbolo)
+            estado = self.proximo(estado, simbolo) if proximo is None else proximo
+            if not self.conjuntos[estado]:
+                break
+        return estado
+
+    def accepts(self, cadeia):
+        # executar pode descartar o cache (e trocar self.finais), então ele vem primeiro
+        estado = self.executar(cadeia)
+        return self.finais[estado]
+
+    def accepts_many(self, cadeias):
+        return [self.accepts(cadeia) for cadeia in cadeias]
@@ -0,0 +1,73 @@
+# Busca de subcadeias (BuscaAfd) num arquivo grande lido via mmap, comparada com re.finditer.
+# Os padrões foram escolhidos para que a semântica do re (mais à esquerda, guloso) coincida com a
+# mais à esquerda e mais longa, então as duas buscas devem achar as mesmas correspondências.
+# Uso: python -m benchmarks.bench_busca [megabytes]
+import mmap
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+from busca import BuscaAfd
+from expressao_regular import compilarRegex
+
+ALFABETO = "abcdefghijklmnopqrstuvwxyz0123456789 "
+PADROES = [
+    "afd",                 # literal raro: quase todo o texto é pulado em C
+    "[0-9]+",              # classe frequente: muitas correspondências curtas
+    "(ab|cd)+e",
+    "[a-z]+ [0-9][0-9]",
+]
+# Texto com dígitos e espaços mais raros que letras: cada byte aleatório é traduzido para um
+# caractere do alfabeto (8 bytes por letra, 2 por dígito, 28 para o espaço)
+PESOS = [8] * 26 + [2] * 10 + [28]
+TRADUCAO = b"".join(c.encode("ascii") * peso for c, peso in zip(ALFABETO, PESOS))
+
+
+def gerar(caminho, megabytes, semente=11):
+    rng = random.Random(semente)
+    with open(caminho, "wb") as f:
+        for _ in range(megabytes):
+            f.write(rng.randbytes(1 << 20).translate(TRADUCAO))
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "texto.txt")
+        inicio = time.perf_counter()
+        gerar(caminho, megabytes)
+        print(f"{megabytes} MiB gerados em {time.perf_counter() - inicio:.1f}s")
+
+        print(f"{'padrão':<20} {'estados':>7} {'achados':>10} {'afd (MiB/s)':>12} {'re (MiB/s)':>12}")
+        with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            for padrao in PADROES:
+                afd = compilarRegex(padrao, alfabeto=ALFABETO)
+                busca = BuscaAfd(afd)
+
+                inicio = time.perf_counter()
+                achados = sum(1 for _ in busca.encontrar(mapa))
+                t_afd = time.perf_counter() - inicio
+
+                expressao = re.compile(padrao.encode("ascii"))
+                inicio = time.perf_counter()
+                achados_re = sum(1 for _ in expressao.finditer(mapa))
+                t_re = time.perf_counter() - inicio
+                assert achados == achados_re, (padrao, achados, achados_re)
+
+                print(
+                    f"{padrao:<20} {len(afd.estados):>7} {achados:>10}"
+                    f" {megabytes / t_afd:>12.1f} {megabytes / t_re:>12.1f}"
+                )
+
+            # Modo "todas" (pares sobrepostos) num trecho de 1 MiB
+            afd = compilarRegex("[0-9]+", alfabeto=ALFABETO)
+            inicio = time.perf_counter()
+            pares = sum(1 for _ in BuscaAfd(afd).encontrar(mapa, fim=1 << 20, modo="todas"))
+            print(f"todas as correspondências de [0-9]+ em 1 MiB: {pares} em {time.perf_counter() - inicio:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Tempo de carga e pico de memória (RSS) do carregarAFD em fluxo x ElementTree completo
+# Uso: python -m benchmarks.bench_carregar [estados] [tamanho_alfabeto]
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+from benchmarks.geradores import afd_aleatorio, escrever_jff
+from main import Afd
+
+
+# Carregador anterior (ET.parse + findall), mantido aqui só como referência
+def carregar_com_arvore(nome_arquivo):
+    raiz = ET.parse(nome_arquivo).getroot()
+    automato = raiz.find("automaton")
+
+    estados = []
+    estado_inicial = None
+    estados_finais = []
+    id_para_nome = {}
+    for estado in automato.findall("state"):
+        nome = estado.attrib["name"]
+        id_para_nome[estado.attrib["id"]] = nome
+        estados.append(nome)
+        if estado.find("initial") is not None:
+            estado_inicial = nome
+        if estado.find("final") is not None:
+            estados_finais.append(nome)
+
+    alfabeto = set()
+    func_transicao = {}
+    for transicao in automato.findall("transition"):
+        origem = id_para_nome[transicao.find("from").text]
+        destino = id_para_nome[transicao.find("to").text]
+        simbolo_elem = transicao.find("read")
+        simbolo = simbolo_elem.text if simbolo_elem is not None else ""
+        alfabeto.add(simbolo)
+        func_transicao[(origem, simbolo)] = destino
+
+    afd = Afd(estados, list(alfabeto), estado_inicial, estados_finais)
+    afd.func_transicao = func_transicao
+    return afd
+
+
+CARREGADORES = {
+    "arvore": carregar_com_arvore,
+    "fluxo": Afd.carregarAFD,
+}
+
+
+# Executado em um processo próprio para que o pico de RSS seja só deste carregador
+def medir_filho(nome, caminho):
+    inicio = time.perf_counter()
+    afd = CARREGADORES[nome](caminho)
+    tempo = time.perf_counter() - inicio
+    pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(tempo, pico_kb, len(afd.func_transicao))
+
+
+def main():
+    if sys.argv[1:2] == ["--filho"]:
+        medir_filho(sys.argv[2], sys.argv[3])
+        return
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    alfabeto = "abcdefghijklmnopqrstuvwxyz"[:k]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "grande.jff")
+        escrever_jff(afd_aleatorio(n, alfabeto, semente=7), caminho)
+        print(f"{n} estados, {n * k} transições, {os.path.getsize(caminho) / 2**20:.1f} MiB")
+
+        for nome in CARREGADORES:
+            saida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_carregar", "--filho", nome, caminho],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            tempo, pico_kb, transicoes = float(saida[0]), int(saida[1]), int(saida[2])
+            print(f"{nome:<10} {tempo:8.3f} s  pico RSS {pico_kb / 1024:8.1f} MiB  ({transicoes} transições)")
+
+
+if __name__ == "__main__":
+    main()
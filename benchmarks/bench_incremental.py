@@ -0,0 +1,52 @@
+# Minimização incremental x minimizar do zero após pequenas edições
+# Uso: python -m benchmarks.bench_incremental [estados] [edicoes]
+import random
+import sys
+import time
+
+from main import Afd
+from incremental import MinimizacaoIncremental
+
+
+# Cadeia em camadas: "a" avança um estado e "b" pula até três; editar perto do início afeta poucos estados
+def afd_em_camadas(n, semente=0):
+    rng = random.Random(semente)
+    estados = [f"s{i}" for i in range(n)]
+    afd = Afd(estados, ["a", "b"], estados[0], [e for i, e in enumerate(estados) if i % 3 == 0])
+    for i in range(n - 1):
+        afd.func_transicao[(estados[i], "a")] = estados[i + 1]
+        afd.func_transicao[(estados[i], "b")] = estados[min(n - 1, i + rng.randint(1, 3))]
+    return afd
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    edicoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    afd = afd_em_camadas(n)
+    rng = random.Random(1)
+
+    inicio = time.perf_counter()
+    incremental = MinimizacaoIncremental(afd)
+    print(f"{n} estados, partição inicial: {time.perf_counter() - inicio:.3f}s")
+
+    t_incremental = t_zero = 0.0
+    reprocessados = 0
+    for _ in range(edicoes):
+        i = rng.randint(0, min(200, n - 5))
+        incremental.definirTransicao(f"s{i}", "b", f"s{i + rng.randint(1, 3)}")
+
+        inicio = time.perf_counter()
+        reprocessados += incremental.atualizar()
+        t_incremental += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        minimo = afd.minimo()
+        t_zero += time.perf_counter() - inicio
+
+    assert incremental.minimo().verificarEquivalencia(minimo)
+    print(f"{edicoes} edições: incremental {t_incremental:.3f}s ({reprocessados} estados reprocessados), "
+          f"do zero {t_zero:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# Compara a aceitação em lote (NumPy) com o laço cadeia a cadeia
+# Uso: python -m benchmarks.bench_lote [quantidade] [tamanho]
+import sys
+import time
+
+from benchmarks.geradores import afd_aleatorio, cadeias_aleatorias
+from lote import LoteNumpy
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tamanho = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    afd = afd_aleatorio(200, "ab", semente=1)
+    cadeias = cadeias_aleatorias(quantidade, tamanho, "ab", semente=2)
+    lote = LoteNumpy(afd)
+
+    t_laco, esperado = cronometrar(lambda: [afd.testarAFD(c) for c in cadeias])
+    t_compilado, r_compilado = cronometrar(lambda: afd.accepts_many(cadeias))
+    t_lote, r_lote = cronometrar(lambda: lote.aceitar(cadeias))
+    assert r_compilado == esperado and r_lote.tolist() == esperado
+
+    print(f"{quantidade} cadeias de tamanho {tamanho}")
+    for nome, t in (("testarAFD (laço)", t_laco), ("accepts_many", t_compilado), ("LoteNumpy", t_lote)):
+        print(f"{nome:<18} {t:8.3f} s  {quantidade / t:12.0f} cadeias/s  {t_laco / t:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Escalabilidade da minimização: Hopcroft x tabela de pares em AFDs aleatórios
+# Uso: python -m benchmarks.bench_minimizacao [maior_expoente] [limite_tabela]
+import copy
+import sys
+import time
+
+from benchmarks.geradores import afd_aleatorio
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    maior_expoente = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    # A tabela de pares é O(n²) em memória e bem mais lenta; só roda até este tamanho
+    limite_tabela = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"{'estados':>8} {'hopcroft (s)':>13} {'tabela (s)':>11} {'classes':>8}")
+    for expoente in range(2, maior_expoente + 1):
+        n = 10 ** expoente
+        afd = afd_aleatorio(n, "ab", semente=expoente)
+
+        t_hopcroft, blocos = cronometrar(lambda: afd.particaoHopcroft())
+        t_tabela = "-"
+        if n <= limite_tabela:
+            copia = copy.deepcopy(afd)
+            t, blocos_tabela = cronometrar(lambda: copia.particaoPorTabela())
+            assert len(blocos_tabela) == len(blocos)
+            t_tabela = f"{t:.3f}"
+
+        print(f"{n:>8} {t_hopcroft:>13.3f} {t_tabela:>11} {len(blocos):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Escalabilidade da aceitação paralela de 1 até N processos, para muitas cadeias e para uma só cadeia
+# Uso: python -m benchmarks.bench_paralelo [quantidade] [tamanho] [max_processos]
+import os
+import sys
+import time
+
+from benchmarks.geradores import afd_aleatorio, cadeias_aleatorias
+from paralelo import AceitacaoParalela
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    tamanho = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    max_processos = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+
+    afd = afd_aleatorio(1000, "ab", semente=3)
+    cadeias = cadeias_aleatorias(quantidade, tamanho, "ab", semente=4)
+
+    inicio = time.perf_counter()
+    esperado = afd.accepts_many(cadeias)
+    t_serial = time.perf_counter() - inicio
+    print(f"{quantidade} cadeias de tamanho {tamanho}; serial: {t_serial:.3f} s")
+
+    print(f"{'processos':>9} {'tempo (s)':>10} {'cadeias/s':>12} {'speedup':>8}")
+    # Potências de 2 até o máximo, mais o próprio máximo
+    contagens = sorted({max_processos} | {2 ** i for i in range(max_processos.bit_length())})
+    for processos in contagens:
+        # O pool é criado fora da medição: o custo fixo é pago uma vez por serviço
+        with AceitacaoParalela(afd, processos) as paralelo:
+            inicio = time.perf_counter()
+            resultado = paralelo.accepts_many(cadeias)
+            tempo = time.perf_counter() - inicio
+        assert resultado == esperado
+        print(f"{processos:>9} {tempo:>10.3f} {quantidade / tempo:>12.0f} {t_serial / tempo:>8.2f}")
+
+    # Uma única cadeia com o mesmo total de símbolos
+    cadeia = "".join(cadeias)
+    inicio = time.perf_counter()
+    esperado = afd.accepts(cadeia)
+    t_serial = time.perf_counter() - inicio
+    print(f"\n1 cadeia de tamanho {len(cadeia)}; serial: {t_serial:.3f} s")
+
+    print(f"{'processos':>9} {'tempo (s)':>10} {'símbolos/s':>12} {'speedup':>8}")
+    for processos in contagens:
+        with AceitacaoParalela(afd, processos) as paralelo:
+            inicio = time.perf_counter()
+            resultado = paralelo.accepts(cadeia)
+            tempo = time.perf_counter() - inicio
+        assert resultado == esperado
+        print(f"{processos:>9} {tempo:>10.3f} {len(cadeia) / tempo:>12.0f} {t_serial / tempo:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Compara compilarRegex com o módulo re: tempo de compilação e vazão de reconhecimento (fullmatch)
+# Uso: python -m benchmarks.bench_regex [quantidade] [tamanho]
+import random
+import re
+import sys
+import time
+
+from expressao_regular import compilarRegex
+
+PADROES = [
+    "(a|b)*abb",
+    "[a-c]+d?[a-c]*",
+    "(ab|ba){2,5}c*",
+    "((a|b)(c|d))*",
+    "[^d]*d[^d]*",
+    "(a|b|c|d){3}(a*|b*)d",
+]
+ALFABETO = "abcd"
+
+
+def cronometrar(funcao, repeticoes=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return (time.perf_counter() - inicio) / repeticoes, resultado
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    tamanho = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    rng = random.Random(5)
+    cadeias = ["".join(rng.choices(ALFABETO, k=rng.randint(0, tamanho))) for _ in range(quantidade)]
+
+    print(f"{quantidade} cadeias de até {tamanho} símbolos")
+    print(f"{'padrão':<24} {'estados':>7} {'comp. afd':>10} {'comp. re':>10} {'afd (c/s)':>12} {'re (c/s)':>12}")
+    for padrao in PADROES:
+        t_comp_afd, afd = cronometrar(lambda: compilarRegex(padrao, alfabeto=ALFABETO), 10)
+
+        def compilar_re():
+            re.purge()
+            return re.compile(padrao)
+        t_comp_re, expressao = cronometrar(compilar_re, 10)
+
+        afd.compilar()
+        t_afd, r_afd = cronometrar(lambda: afd.accepts_many(cadeias))
+        t_re, r_re = cronometrar(lambda: [expressao.fullmatch(c) is not None for c in cadeias])
+        assert r_afd == r_re
+
+        print(
+            f"{padrao:<24} {len(afd.estados):>7} {t_comp_afd * 1e3:>8.2f}ms {t_comp_re * 1e3:>8.2f}ms"
+            f" {quantidade / t_afd:>12.0f} {quantidade / t_re:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
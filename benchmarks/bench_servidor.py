@@ -0,0 +1,103 @@
+# Gerador de carga para o servidor.py: várias conexões simultâneas, cada uma com até
+# --profundidade requisições em andamento, medindo vazão e latências (p50, p99, máxima).
+# Sem --endereco, sobe um servidor num processo à parte com um AFD aleatório, via socket Unix.
+# Uso:
+#   python -m benchmarks.bench_servidor
+#   python -m benchmarks.bench_servidor --tipo lote --lote 1000 --conexoes 8
+#   python -m benchmarks.bench_servidor --endereco 127.0.0.1:8765 --afd afd_xml
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.geradores import afd_aleatorio, cadeias_aleatorias, escrever_jff
+from servidor import ClienteAfd
+
+ALFABETO = "ab"
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+async def conexao(endereco, args, cadeias, latencias):
+    cliente = await ClienteAfd.conectar(endereco)
+    vagas = asyncio.Semaphore(args.profundidade)
+    quantidade = args.requisicoes // args.conexoes
+
+    async def uma(i):
+        inicio = time.perf_counter()
+        try:
+            if args.tipo == "lote":
+                deslocamento = (i * args.lote) % (len(cadeias) - args.lote)
+                await cliente.aceitarLote(args.afd, cadeias[deslocamento:deslocamento + args.lote])
+            else:
+                await cliente.aceitar(args.afd, cadeias[i % len(cadeias)])
+            latencias.append(time.perf_counter() - inicio)
+        finally:
+            vagas.release()
+
+    tarefas = []
+    for i in range(quantidade):
+        await vagas.acquire()
+        tarefas.append(asyncio.create_task(uma(i)))
+    await asyncio.gather(*tarefas)
+    await cliente.fechar()
+
+
+async def gerarCarga(endereco, args):
+    cadeias = cadeias_aleatorias(max(10_000, 2 * args.lote), args.tamanho, ALFABETO, semente=7)
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(conexao(endereco, args, cadeias, latencias) for _ in range(args.conexoes)))
+    total = time.perf_counter() - inicio
+
+    por_requisicao = args.lote if args.tipo == "lote" else 1
+    print(f"{len(latencias)} requisições ({args.tipo}) em {args.conexoes} conexões, profundidade {args.profundidade}")
+    print(f"tempo total:  {total:.2f}s")
+    print(f"vazão:        {len(latencias) / total:.0f} req/s ({len(latencias) * por_requisicao / total:.0f} cadeias/s)")
+    print(f"latência p50: {percentil(latencias, 0.50) * 1e3:.3f} ms")
+    print(f"latência p99: {percentil(latencias, 0.99) * 1e3:.3f} ms")
+    print(f"latência máx: {max(latencias) * 1e3:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de carga para o servidor de AFDs")
+    parser.add_argument("--endereco", help="host:porta ou unix:/caminho de um servidor já rodando")
+    parser.add_argument("--afd", default="bench", help="nome do AFD no registro do servidor")
+    parser.add_argument("--estados", type=int, default=1000, help="estados do AFD gerado (sem --endereco)")
+    parser.add_argument("--tipo", choices=("aceitar", "lote"), default="aceitar")
+    parser.add_argument("--requisicoes", type=int, default=20_000)
+    parser.add_argument("--conexoes", type=int, default=16)
+    parser.add_argument("--profundidade", type=int, default=8, help="requisições em andamento por conexão")
+    parser.add_argument("--tamanho", type=int, default=64, help="tamanho das cadeias")
+    parser.add_argument("--lote", type=int, default=100, help="cadeias por requisição no tipo lote")
+    args = parser.parse_args()
+
+    if args.endereco:
+        asyncio.run(gerarCarga(args.endereco, args))
+        return
+
+    with tempfile.TemporaryDirectory() as pasta:
+        escrever_jff(afd_aleatorio(args.estados, ALFABETO, semente=1), os.path.join(pasta, f"{args.afd}.jff"))
+        socket = os.path.join(pasta, "afd.sock")
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        processo = subprocess.Popen(
+            [sys.executable, os.path.join(raiz, "servidor.py"), pasta, "--unix", socket],
+            stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            # O servidor avisa na saída padrão quando o registro está carregado
+            print(processo.stdout.readline().strip())
+            asyncio.run(gerarCarga(f"unix:{socket}", args))
+        finally:
+            processo.terminate()
+            processo.wait()
+
+
+if __name__ == "__main__":
+    main()
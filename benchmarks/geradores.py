@@ -0,0 +1,63 @@
+# Geradores de AFDs sintéticos (com semente) usados pelos benchmarks
+import random
+
+from main import Afd
+
+
+# AFD completo com transições sorteadas
+def afd_aleatorio(n_estados, alfabeto="01", semente=0, prop_finais=0.5):
+    rng = random.Random(semente)
+    estados = [f"q{i}" for i in range(n_estados)]
+    alfabeto = list(alfabeto)
+    finais = [e for e in estados if rng.random() < prop_finais]
+
+    afd = Afd(estados, alfabeto, estados[0], finais)
+    for estado in estados:
+        for simbolo in alfabeto:
+            afd.func_transicao[(estado, simbolo)] = rng.choice(estados)
+    return afd
+
+
+# Cadeia longa: o primeiro símbolo avança um estado e os outros voltam para um estado anterior
+# sorteado. Com o último estado final, nenhum par de estados é equivalente e a profundidade é n.
+def afd_cadeia(n_estados, alfabeto="01", semente=0, prop_finais=0.1):
+    rng = random.Random(semente)
+    estados = [f"q{i}" for i in range(n_estados)]
+    alfabeto = list(alfabeto)
+    finais = [e for e in estados[:-1] if rng.random() < prop_finais] + estados[-1:]
+
+    afd = Afd(estados, alfabeto, estados[0], finais)
+    for i, estado in enumerate(estados):
+        if i + 1 < n_estados:
+            afd.func_transicao[(estado, alfabeto[0])] = estados[i + 1]
+        for simbolo in alfabeto[1:]:
+            afd.func_transicao[(estado, simbolo)] = estados[rng.randint(0, i)]
+    return afd
+
+
+# Conta as ocorrências de "simbolo" módulo "modulo"; aceita quando a contagem cai em "residuos".
+# O produto de contadores com módulos primos entre si alcança todos os pares de estados.
+def afd_contador(modulo, alfabeto="01", simbolo=None, residuos=(0,)):
+    alfabeto = list(alfabeto)
+    simbolo = alfabeto[0] if simbolo is None else simbolo
+    estados = [f"c{i}" for i in range(modulo)]
+
+    afd = Afd(estados, alfabeto, estados[0], [estados[r % modulo] for r in residuos])
+    for i, estado in enumerate(estados):
+        for s in alfabeto:
+            afd.func_transicao[(estado, s)] = estados[(i + 1) % modulo if s == simbolo else i]
+    return afd
+
+
+# Cadeias aleatórias sobre o alfabeto
+def cadeias_aleatorias(quantidade, tamanho, alfabeto="01", semente=0):
+    rng = random.Random(semente)
+    return ["".join(rng.choices(alfabeto, k=tamanho)) for _ in range(quantidade)]
+
+
+# Escreve o AFD em um arquivo .jff com o próprio salvarAFD (mesmo xml e escape do menu); uma
+# tabela compilada é convertida de volta para Afd antes
+def escrever_jff(afd, caminho):
+    if not isinstance(afd, Afd):
+        afd = afd.paraAfd()
+    afd.salvarAFD(caminho)
@@ -0,0 +1,188 @@
+# Suíte de desempenho: mede tempo e pico de memória de cada operação pública do Afd em AFDs
+# sintéticos de vários tamanhos, grava o resultado em JSON e compara com uma execução anterior.
+# Uso:
+#   python -m benchmarks.suite --saida base.json
+#   python -m benchmarks.suite --saida atual.json --comparar base.json
+#   python -m benchmarks.suite --atual atual.json --comparar base.json   (só compara, sem medir)
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.geradores import afd_aleatorio, afd_cadeia, afd_contador, cadeias_aleatorias, escrever_jff
+from main import Afd
+
+ALFABETO = "ab"
+
+NOMES = [
+    "carregarAFD", "salvarAFD", "testarAFD", "removeDesconexos", "buscaEstadosEquivalentes", "minimizar",
+    "uniao", "intersecao", "complemento", "diferenca", "verificarEquivalencia",
+]
+
+# Operações O(n²) só rodam até este número de estados (a não ser que --limite-quadratico mude)
+QUADRATICAS = {"buscaEstadosEquivalentes"}
+
+
+# Segundo operando das operações binárias nos casos cadeia e aleatorio: pequeno, para que o
+# produto cresça linearmente com n (o caso produto é o que mede produtos grandes)
+ESTADOS_SEGUNDO = 16
+
+
+# Pares de operandos (a, b) de cada caso para um tamanho n
+def casoCadeia(n):
+    return afd_cadeia(n, ALFABETO, semente=1), afd_cadeia(ESTADOS_SEGUNDO, ALFABETO, semente=2)
+
+
+def casoAleatorio(n):
+    return afd_aleatorio(n, ALFABETO, semente=1), afd_aleatorio(ESTADOS_SEGUNDO, ALFABETO, semente=2)
+
+
+# Contadores com módulos m e m + 1 (primos entre si): o produto tem cerca de n estados
+def casoProduto(n):
+    m = max(2, math.isqrt(n))
+    return afd_contador(m, ALFABETO, "a"), afd_contador(m + 1, ALFABETO, "b")
+
+
+CASOS = {"cadeia": casoCadeia, "aleatorio": casoAleatorio, "produto": casoProduto}
+
+
+# Cada operação recebe os operandos e devolve uma função que prepara uma execução (cópias e
+# arquivos ficam fora da medição) e retorna o que será cronometrado
+def operacoes(a, b, pasta, cadeias):
+    jff = os.path.join(pasta, "entrada.jff")
+    escrever_jff(a, jff)
+    saida = os.path.join(pasta, "saida.jff")
+    minimo = a.minimo()
+
+    return {
+        "carregarAFD": lambda: lambda: Afd.carregarAFD(jff),
+        "salvarAFD": lambda: lambda: a.salvarAFD(saida),
+        "testarAFD": lambda: lambda: [a.testarAFD(c) for c in cadeias],
+        "removeDesconexos": lambda: a.copia().removeDesconexos,
+        "buscaEstadosEquivalentes": lambda: a.copia().buscaEstadosEquivalentes,
+        "minimizar": lambda: a.copia().minimizar,
+        "uniao": lambda: lambda: a.uniao(b),
+        "intersecao": lambda: lambda: a.intersecao(b),
+        "complemento": lambda: a.complemento,
+        "diferenca": lambda: lambda: a.diferenca(b),
+        # Linguagens iguais: a verificação percorre todo o produto
+        "verificarEquivalencia": lambda: lambda: a.verificarEquivalencia(minimo),
+    }
+
+
+# Melhor tempo entre as repetições e pico de memória (tracemalloc) numa execução à parte
+def medir(preparar, repeticoes):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        funcao = preparar()
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+
+    funcao = preparar()
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return melhor, pico
+
+
+def executar(tamanhos, casos, nomes, repeticoes, limite_quadratico):
+    resultados = []
+    cadeias = cadeias_aleatorias(1000, 64, ALFABETO, semente=3)
+    with tempfile.TemporaryDirectory() as pasta:
+        for caso in casos:
+            for n in tamanhos:
+                a, b = CASOS[caso](n)
+                for nome, preparar in operacoes(a, b, pasta, cadeias).items():
+                    if nome not in nomes or (nome in QUADRATICAS and len(a.estados) > limite_quadratico):
+                        continue
+                    tempo, pico = medir(preparar, repeticoes)
+                    resultados.append({
+                        "caso": caso,
+                        "tamanho": n,
+                        "estados": len(a.estados),
+                        "operacao": nome,
+                        "tempo_s": tempo,
+                        "memoria_pico_bytes": pico,
+                    })
+                    print(f"{caso:<10} {n:>8} {nome:<25} {tempo:10.4f}s {pico / 2**20:10.2f} MiB", flush=True)
+    return {
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeticoes": repeticoes,
+        "resultados": resultados,
+    }
+
+
+# Lista as medições piores que a base além da tolerância (relativa) e de um mínimo absoluto,
+# para que ruído em operações de microssegundos não conte como regressão
+def comparar(base, atual, tolerancia, minimo_tempo=1e-3, minimo_memoria=64 * 1024):
+    anteriores = {(r["caso"], r["tamanho"], r["operacao"]): r for r in base["resultados"]}
+    regressoes = []
+    for r in atual["resultados"]:
+        anterior = anteriores.get((r["caso"], r["tamanho"], r["operacao"]))
+        if anterior is None:
+            continue
+        for campo, minimo in (("tempo_s", minimo_tempo), ("memoria_pico_bytes", minimo_memoria)):
+            antes, depois = anterior[campo], r[campo]
+            if depois > antes * (1 + tolerancia) and depois - antes > minimo:
+                regressoes.append((r["caso"], r["tamanho"], r["operacao"], campo, antes, depois))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suíte de desempenho das operações do Afd")
+    parser.add_argument("--tamanhos", default="100,1000,10000", help="tamanhos separados por vírgula")
+    parser.add_argument("--casos", default=",".join(CASOS), help="casos separados por vírgula")
+    parser.add_argument("--operacoes", default=None, help="operações separadas por vírgula (padrão: todas)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--limite-quadratico", type=int, default=1000)
+    parser.add_argument("--saida", help="arquivo JSON onde gravar os resultados")
+    parser.add_argument("--atual", help="JSON já medido (pula a medição)")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior usada como base")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="piora relativa aceita (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.atual:
+        with open(args.atual, encoding="utf-8") as f:
+            atual = json.load(f)
+    else:
+        tamanhos = [int(t) for t in args.tamanhos.split(",")]
+        casos = args.casos.split(",")
+        for caso in casos:
+            if caso not in CASOS:
+                parser.error(f"caso desconhecido: {caso}")
+        nomes = args.operacoes.split(",") if args.operacoes else NOMES
+        for nome in nomes:
+            if nome not in NOMES:
+                parser.error(f"operação desconhecida: {nome}")
+        atual = executar(tamanhos, casos, nomes, args.repeticoes, args.limite_quadratico)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(atual, f, indent=2)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)
+        regressoes = comparar(base, atual, args.tolerancia)
+        for caso, n, operacao, campo, antes, depois in regressoes:
+            # Base zero (ex.: pico de memória não medido): não há razão a mostrar
+            razao = f"{depois / antes:.2f}x" if antes else "∞"
+            print(f"REGRESSÃO {caso} n={n} {operacao} {campo}: {antes:.6g} -> {depois:.6g} ({razao})")
+        if regressoes:
+            sys.exit(1)
+        print("Nenhuma regressão acima da tolerância.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# Busca de subcadeias aceitas pelo AFD em textos grandes, numa única passada. Cada posição do
+# texto inicia uma "linha de execução" (estado do AFD + posição de início); linhas que caem no mesmo
+# estado têm o mesmo futuro, então só a de início mais à esquerda é mantida e o número de linhas
+# vivas nunca passa do número de estados.
+#
+# Modos: "mais_longo" (padrão) devolve, sem sobreposição, a correspondência que começa mais à
+# esquerda e, entre essas, a mais longa; "todas" devolve todo par (início, fim) aceito. Cadeias vazias
+# nunca são devolvidas. O texto pode ser str, bytes, bytearray ou mmap (bytes são lidos como
+# caracteres latin-1, como em AfdCompilado.executarBytes).
+#
+# No modo "mais_longo" a lista ordenada de linhas vivas é ela mesma determinizada sob demanda: cada
+# configuração (estados das linhas em ordem de início) vira um estado com transições em cache, e o
+# laço principal faz uma consulta a dicionário por símbolo. As posições de início não são guardadas
+# durante a varredura: ao fim de cada correspondência, o início é achado voltando pelo AFD reverso.
+# Quando nenhuma linha está viva, o texto é percorrido em C (re.search por uma classe de caracteres)
+# até o próximo símbolo que sai do estado inicial.
+import mmap
+import re
+
+MODOS = ("mais_longo", "todas")
+
+# Configurações especiais: nenhuma linha viva procurando / estendendo uma correspondência
+BUSCA_VAZIA, EXTENSAO_VAZIA = 0, 1
+
+# Acima disso o cache de configurações é descartado e recomeça (evita explosão de memória)
+LIMITE_CONFIGURACOES = 10_000
+
+# Tamanho dos trechos de str copiados por vez (bytes são lidos sem cópia, via memoryview)
+BLOCO_TEXTO = 4096
+
+
+# Cache das configurações de uma varredura: configs[i] é a tupla de estados do AFD em ordem de
+# início, estendendo[i] diz se já há uma correspondência (e novas linhas deixam de ser criadas)
+class Configuracoes:
+    def __init__(self, busca, coluna):
+        self.busca = busca
+        self.coluna = coluna
+        self.configs, self.estendendo, self.linhas, self.especial, self.aceita = [], [], [], [], []
+        self.ids = {}
+        self.limpar()
+
+    # Esvazia o cache no lugar (o laço de busca guarda referências para estas listas)
+    def limpar(self):
+        for lista in (self.configs, self.estendendo, self.linhas, self.especial, self.aceita):
+            lista.clear()
+        self.ids.clear()
+        self.internar(((), False))
+        self.internar(((), True))
+
+    # Calcula (e guarda) a configuração seguinte a "config" lendo "simbolo"
+    def expandir(self, config, simbolo):
+        busca = self.busca
+        tabela, finais, morto = busca.tabela, busca.finais, busca.morto
+        c = self.coluna(simbolo)
+        estendendo = self.estendendo[config]
+
+        novos = []
+        for e in self.configs[config]:
+            d = tabela[e][c]
+            if d != morto and d not in novos:
+                novos.append(d)
+        if not estendendo:
+            d = tabela[busca.inicial][c]
+            if d != morto and d not in novos:
+                novos.append(d)
+
+        # A primeira linha final é a de início mais à esquerda que aceita agora; as que começaram
+        # depois dela já não podem vencer
+        for j, e in enumerate(novos):
+            if finais[e]:
+                del novos[j + 1:]
+                estendendo = True
+                break
+
+        chave = (tuple(novos), estendendo)
+        proxima = self.ids.get(chave)
+        if proxima is None:
+            if len(self.configs) >= LIMITE_CONFIGURACOES:
+                # A configuração de origem deixa de existir; só a de destino é recriada
+                self.limpar()
+                return self.internar(chave)
+            proxima = self.internar(chave)
+        self.linhas[config][simbolo] = proxima
+        return proxima
+
+    def internar(self, chave):
+        estados, estendendo = chave
+        config = self.ids.get(chave)
+        if config is None:
+            config = len(self.configs)
+            self.ids[chave] = config
+            self.configs.append(estados)
+            self.estendendo.append(estendendo)
+            self.linhas.append({})
+            finais = self.busca.finais
+            aceita = bool(estados) and finais[estados[-1]]  # só a última linha pode ser final
+            self.aceita.append(aceita)
+            self.especial.append(aceita or not estados)
+        return config
+
+
+class BuscaAfd:
+    def __init__(self, afd):
+        compilado = afd.compilar() if hasattr(afd, "compilar") else afd
+        self.compilado = compilado
+        k = len(compilado.classes)
+        self.morto = compilado.morto
+        self.inicial = compilado.inicial
+        self.finais = compilado.finais
+
+        # Coluna extra k: símbolo fora do alfabeto (leva ao estado morto)
+        self.tabela = [list(linha) + [compilado.morto] for linha in compilado.tabela]
+        self.coluna_caractere = compilado.simbolo_para_id
+        self.coluna_byte = [k if c is None else c for c in compilado.classesPorByte()]
+        self.desconhecido = k
+
+        # AFD reverso determinizado sob demanda: (conjunto de estados, coluna) -> conjunto anterior
+        self.reverso = {}
+        self.finais_reverso = frozenset(e for e in range(compilado.morto) if compilado.finais[e])
+
+        # Símbolos que tiram o AFD do estado inicial: só eles podem começar uma correspondência
+        iniciadores = [
+            simbolo for simbolo, c in compilado.simbolo_para_id.items()
+            if compilado.inicial != compilado.morto and compilado.tabela[compilado.inicial][c] != compilado.morto
+        ]
+        self.salto_texto = self.salto_bytes = None
+        if all(isinstance(s, str) and len(s) == 1 for s in iniciadores):
+            classe = "".join(re.escape(s) for s in iniciadores)
+            self.salto_texto = re.compile(f"[{classe}]") if classe else None
+            bytes_iniciadores = [s for s in iniciadores if ord(s) < 256]
+            classe = b"".join(re.escape(s.encode("latin-1")) for s in bytes_iniciadores)
+            self.salto_bytes = re.compile(b"[" + classe + b"]") if classe else None
+        self.sem_iniciadores = not iniciadores
+
+    # Gerador de pares (início, fim) com texto[início:fim] aceito
+    def encontrar(self, texto, inicio=0, fim=None, modo="mais_longo"):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de busca desconhecido: {modo}")
+        if self.sem_iniciadores:
+            return iter(())
+        fim = len(texto) if fim is None else min(fim, len(texto))
+
+        if isinstance(texto, str):
+            colunas = self.coluna_caractere
+            desconhecido = self.desconhecido
+
+            def coluna(c):
+                return colunas.get(c, desconhecido)
+            salto = self.salto_texto
+        elif isinstance(texto, (bytes, bytearray, memoryview, mmap.mmap)):
+            coluna = self.coluna_byte.__getitem__
+            salto = self.salto_bytes
+        else:
+            # Sequência qualquer de símbolos (sem salto acelerado)
+            colunas = self.coluna_caractere
+            desconhecido = self.desconhecido
+
+            def coluna(c):
+                return colunas.get(c, desconhecido)
+            salto = None
+
+        if modo == "todas":
+            return self.todas(texto, inicio, fim, coluna, salto)
+        return self.maisLongo(texto, inicio, fim, coluna, salto)
+
+    # Lê o arquivo via mmap (bytes), sem carregá-lo na memória
+    def encontrarArquivo(self, caminho, modo="mais_longo"):
+        with open(caminho, "rb") as f:
+            if f.seek(0, 2) == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                yield from self.encontrar(mapa, modo=modo)
+
+    def maisLongo(self, texto, i, fim, coluna, salto):
+        configuracoes = Configuracoes(self, coluna)
+        linhas, especial, aceita = configuracoes.linhas, configuracoes.especial, configuracoes.aceita
+        expandir = configuracoes.expandir
+        visao = memoryview(texto) if not isinstance(texto, (str, list, tuple)) else None
+
+        recomeco = i           # nenhuma linha viva começou antes daqui (limite da volta pelo AFD reverso)
+        fim_melhor = None      # fim da melhor correspondência da procura atual
+        config = BUSCA_VAZIA
+        try:
+            while True:
+                if i >= fim:
+                    if fim_melhor is None:
+                        return
+                    # Fim do texto com uma correspondência pendente: devolve e recomeça depois dela
+                    yield self.inicioDaCorrespondencia(texto, recomeco, fim_melhor, coluna), fim_melhor
+                    i = fim_melhor
+                    fim_melhor, config = None, BUSCA_VAZIA
+                    continue
+
+                if config == BUSCA_VAZIA:
+                    if salto is not None:
+                        encontrado = salto.search(texto, i, fim)
+                        if encontrado is None:
+                            return
+                        i = encontrado.start()
+                    # Todas as linhas anteriores morreram: a próxima correspondência começa daqui em diante
+                    recomeco = i
+
+                trecho = visao[i:fim] if visao is not None else texto[i:min(fim, i + BLOCO_TEXTO)]
+                lidos = 0
+                for simbolo in trecho:
+                    lidos += 1
+                    proxima = linhas[config].get(simbolo)
+                    config = expandir(config, simbolo) if proxima is None else proxima
+                    if especial[config]:
+                        break
+                i += lidos
+
+                if aceita[config]:
+                    fim_melhor = i
+                elif config == EXTENSAO_VAZIA:
+                    yield self.inicioDaCorrespondencia(texto, recomeco, fim_melhor, coluna), fim_melhor
+                    # Recomeça no fim da correspondência (o trecho lido além dela é relido)
+                    i = fim_melhor
+                    fim_melhor, config = None, BUSCA_VAZIA
+        finally:
+            if visao is not None:
+                visao.release()
+
+    # Menor início >= limite com texto[início:fim] aceito, voltando pelo AFD reverso a partir de fim
+    def inicioDaCorrespondencia(self, texto, limite, fim, coluna):
+        reverso, tabela, morto, inicial = self.reverso, self.tabela, self.morto, self.inicial
+        conjunto = self.finais_reverso
+        inicio = fim
+        for j in range(fim - 1, limite - 1, -1):
+            c = coluna(texto[j])
+            anterior = reverso.get((conjunto, c))
+            if anterior is None:
+                anterior = frozenset(p for p in range(morto) if tabela[p][c] in conjunto)
+                reverso[(conjunto, c)] = anterior
+            conjunto = anterior
+            if not conjunto:
+                break
+            if inicial in conjunto:
+                inicio = j
+        return inicio
+
+    def todas(self, texto, i, fim, coluna, salto):
+        tabela, finais, morto, inicial = self.tabela, self.finais, self.morto, self.inicial
+        grupos = {}  # estado -> inícios das linhas nesse estado
+
+        while i < fim:
+            if not grupos and salto is not None:
+                encontrado = salto.search(texto, i, fim)
+                if encontrado is None:
+                    return
+                i = encontrado.start()
+
+            c = coluna(texto[i])
+            novos = {}
+            for e, inicios in grupos.items():
+                d = tabela[e][c]
+                if d != morto:
+                    if d in novos:
+                        novos[d].extend(inicios)
+                    else:
+                        novos[d] = inicios
+            d = tabela[inicial][c]
+            if d != morto:
+                if d in novos:
+                    novos[d] = novos[d] + [i]
+                else:
+                    novos[d] = [i]
+            i += 1
+
+            aceitos = [s for e, inicios in novos.items() if finais[e] for s in inicios]
+            aceitos.sort()
+            for s in aceitos:
+                yield s, i
+            grupos = novos
+
+
+# Atalho para uma busca só
+def buscar(afd, texto, modo="mais_longo"):
+    return BuscaAfd(afd).encontrar(texto, modo=modo)
@@ -0,0 +1,118 @@
+# Cache das operações entre AFDs. Cada operando é identificado pela assinatura (hash da forma
+# canônica, Afd.assinatura), então AFDs com a mesma linguagem e alfabeto compartilham os resultados,
+# mesmo com nomes de estados diferentes. Os resultados ficam num LRU limitado em memória e,
+# opcionalmente, num diretório (formato binário de salvarBinario) que sobrevive entre execuções.
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from main import Afd
+
+# operação -> (função, comutativa); nas comutativas a ordem dos operandos não muda a chave
+OPERACOES = {
+    "uniao": (lambda afd, *outros: afd.uniao(*outros), True),
+    "intersecao": (lambda afd, *outros: afd.intersecao(*outros), True),
+    "diferenca": (lambda afd, *outros: afd.diferenca(*outros), False),
+    "complemento": (lambda afd: afd.complemento(), False),
+    "minimizar": (lambda afd: afd.minimo(), False),
+}
+
+
+class CacheOperacoes:
+    def __init__(self, capacidade=128, diretorio=None):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self.capacidade = capacidade
+        self.diretorio = diretorio
+        self.resultados = OrderedDict()  # chave -> Afd, do menos para o mais recente
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+
+    # Chave (operação, assinaturas dos operandos)
+    def chave(self, operacao, operandos):
+        if operacao not in OPERACOES:
+            raise ValueError(f"Operação desconhecida: {operacao}")
+        assinaturas = [afd.assinatura() for afd in operandos]
+        if OPERACOES[operacao][1]:
+            assinaturas.sort()
+        return (operacao, *assinaturas)
+
+    def caminho(self, chave):
+        nome = hashlib.sha256(repr(chave).encode("utf-8")).hexdigest()
+        return os.path.join(self.diretorio, f"{chave[0]}-{nome[:32]}.afdb")
+
+    # Aplica a operação, reaproveitando um resultado já calculado. Devolve sempre uma cópia,
+    # então o chamador pode alterar o resultado sem afetar o cache.
+    def executar(self, operacao, *operandos):
+        chave = self.chave(operacao, operandos)
+        resultado = self.consultar(chave)
+        if resultado is None:
+            resultado = self.guardar(chave, *self.calcular(chave, operandos))
+        return resultado.copia()
+
+    # Resultado em memória (o próprio objeto guardado, não uma cópia) ou None
+    def consultar(self, chave):
+        resultado = self.resultados.get(chave)
+        if resultado is not None:
+            self.resultados.move_to_end(chave)
+            self.acertos += 1
+        return resultado
+
+    # Lê do diretório ou calcula, sem tocar no LRU (pode rodar fora da trava de quem compartilha o
+    # cache entre threads). "aplicar", se dado, calcula no lugar da função de OPERACOES (ex.: em
+    # outro processo). Devolve (resultado, veio_do_disco).
+    def calcular(self, chave, operandos, aplicar=None):
+        if self.diretorio is not None and os.path.exists(self.caminho(chave)):
+            return Afd.carregarBinario(self.caminho(chave)), True
+
+        resultado = aplicar() if aplicar is not None else OPERACOES[chave[0]][0](*operandos)
+        if self.diretorio is not None:
+            # Grava num temporário e renomeia: outro processo nunca lê um arquivo pela metade
+            temporario = f"{self.caminho(chave)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            resultado.salvarBinario(temporario)
+            os.replace(temporario, self.caminho(chave))
+        return resultado, False
+
+    # Guarda no LRU (descartando o menos recente) e devolve o objeto guardado
+    def guardar(self, chave, resultado, do_disco=False):
+        if do_disco:
+            self.acertos_disco += 1
+        else:
+            self.falhas += 1
+        self.resultados[chave] = resultado
+        self.resultados.move_to_end(chave)
+        if len(self.resultados) > self.capacidade:
+            self.resultados.popitem(last=False)
+        return resultado
+
+    def uniao(self, afd, *outros):
+        return self.executar("uniao", afd, *outros)
+
+    def intersecao(self, afd, *outros):
+        return self.executar("intersecao", afd, *outros)
+
+    def diferenca(self, afd, *outros):
+        return self.executar("diferenca", afd, *outros)
+
+    def complemento(self, afd):
+        return self.executar("complemento", afd)
+
+    def minimizar(self, afd):
+        return self.executar("minimizar", afd)
+
+    # Esvazia a memória (os arquivos do diretório, se houver, continuam valendo)
+    def limpar(self):
+        self.resultados.clear()
+
+    def estatisticas(self):
+        return {
+            "acertos": self.acertos,
+            "acertos_disco": self.acertos_disco,
+            "falhas": self.falhas,
+            "tamanho": len(self.resultados),
+            "capacidade": self.capacidade,
+        }
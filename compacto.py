@@ -0,0 +1,248 @@
+# Representação compacta do AFD: estados e símbolos são ids inteiros com tabelas de nomes,
+# as transições ficam num array('i') plano (linha por estado, -1 = sem transição) e os estados
+# finais num conjunto de bits. Os atributos do Afd (estados, alfabeto, func_transicao, ...)
+# continuam disponíveis como propriedades, então todos os métodos do Afd funcionam sobre ela.
+from array import array
+from collections.abc import MutableMapping, Set
+
+from main import Afd, AfdCompilado
+
+SEM_TRANSICAO = -1
+
+
+class AfdCompacto(Afd):
+    __slots__ = (
+        "nomes", "id_estado", "simbolos", "id_simbolo", "transicoes", "bits_finais", "inicial",
+        "_estados", "_alfabeto",
+    )
+
+    # Construtor (mesma assinatura do Afd)
+    def __init__(self, estados, alfabeto, estado_inicial, estados_finais):
+        self.nomes = []
+        self.id_estado = {}
+        self.simbolos = list(dict.fromkeys(alfabeto))
+        self.id_simbolo = {simbolo: i for i, simbolo in enumerate(self.simbolos)}
+        self.transicoes = array("i")
+        self.bits_finais = bytearray()
+        self.inicial = SEM_TRANSICAO
+        self._compilado = None
+        self._estados = None   # tuplas de nomes em cache, refeitas quando surge estado/símbolo novo
+        self._alfabeto = None
+
+        for estado in estados:
+            self.internarEstado(estado)
+        self.estado_inicial = estado_inicial
+        self.estados_finais = estados_finais
+
+    # Converte um Afd comum
+    @classmethod
+    def deAfd(cls, afd):
+        compacto = cls(afd.estados, afd.alfabeto, afd.estado_inicial, afd.estados_finais)
+        compacto.func_transicao = afd.func_transicao
+        return compacto
+
+    # Converte de volta para um Afd com listas e dicionário
+    def paraAfd(self):
+        afd = Afd(self.estados, self.alfabeto, self.estado_inicial, self.estados_finais)
+        afd.func_transicao = self.func_transicao.copy()
+        return afd
+
+    # Id do estado, criando uma linha vazia na tabela se ele ainda não existe
+    def internarEstado(self, estado):
+        i = self.id_estado.get(estado)
+        if i is None:
+            i = self.id_estado[estado] = len(self.nomes)
+            self.nomes.append(estado)
+            self._estados = None
+            self.transicoes.extend([SEM_TRANSICAO] * len(self.simbolos))
+            if len(self.bits_finais) * 8 < len(self.nomes):
+                self.bits_finais.append(0)
+        return i
+
+    # Id do símbolo; um símbolo novo acrescenta uma coluna (reorganiza a tabela)
+    def internarSimbolo(self, simbolo):
+        c = self.id_simbolo.get(simbolo)
+        if c is None:
+            k = len(self.simbolos)
+            antigas = self.transicoes
+            self.transicoes = array("i")
+            for i in range(len(self.nomes)):
+                self.transicoes.extend(antigas[i * k:(i + 1) * k])
+                self.transicoes.append(SEM_TRANSICAO)
+            c = self.id_simbolo[simbolo] = k
+            self.simbolos.append(simbolo)
+            self._alfabeto = None
+        return c
+
+    def ehFinal(self, i):
+        return self.bits_finais[i >> 3] >> (i & 7) & 1
+
+    # Tupla em cache: os métodos herdados consultam self.estados várias vezes por operação
+    @property
+    def estados(self):
+        if self._estados is None:
+            self._estados = tuple(self.nomes)
+        return self._estados
+
+    # Trocar o conjunto de estados mantém só as transições e finais entre estados que continuam
+    @estados.setter
+    def estados(self, estados):
+        antigo = (self.nomes, self.id_estado, self.transicoes, list(self.estados_finais), self.estado_inicial)
+        nomes, id_estado, transicoes, finais, inicial = antigo
+        k = len(self.simbolos)
+
+        self.nomes, self.id_estado, self._estados = [], {}, None
+        self.transicoes, self.bits_finais = array("i"), bytearray()
+        for estado in estados:
+            self.internarEstado(estado)
+
+        for i, estado in enumerate(self.nomes):
+            j = id_estado.get(estado)
+            if j is None:
+                continue
+            linha = transicoes[j * k:(j + 1) * k]
+            for c in range(k):
+                destino = linha[c]
+                if destino != SEM_TRANSICAO:
+                    destino = self.id_estado.get(nomes[destino], SEM_TRANSICAO)
+                self.transicoes[i * k + c] = destino
+
+        self.estados_finais = [estado for estado in finais if estado in self.id_estado]
+        self.inicial = self.id_estado.get(inicial, SEM_TRANSICAO)
+        self._compilado = None
+
+    @property
+    def alfabeto(self):
+        if self._alfabeto is None:
+            self._alfabeto = tuple(self.simbolos)
+        return self._alfabeto
+
+    @alfabeto.setter
+    def alfabeto(self, alfabeto):
+        for simbolo in alfabeto:
+            self.internarSimbolo(simbolo)
+        self._compilado = None
+
+    @property
+    def estado_inicial(self):
+        return None if self.inicial == SEM_TRANSICAO else self.nomes[self.inicial]
+
+    @estado_inicial.setter
+    def estado_inicial(self, estado):
+        self.inicial = SEM_TRANSICAO if estado is None else self.internarEstado(estado)
+        self._compilado = None
+
+    # Visão de conjunto sobre os bits: "estado in afd.estados_finais" é O(1)
+    @property
+    def estados_finais(self):
+        return FinaisCompactos(self)
+
+    @estados_finais.setter
+    def estados_finais(self, estados_finais):
+        ids = [self.internarEstado(estado) for estado in estados_finais]
+        self.bits_finais = bytearray(len(self.bits_finais))
+        for i in ids:
+            self.bits_finais[i >> 3] |= 1 << (i & 7)
+        self._compilado = None
+
+    @property
+    def func_transicao(self):
+        return TransicoesCompactas(self)
+
+    @func_transicao.setter
+    def func_transicao(self, func_transicao):
+        itens = list(func_transicao.items())
+        self.transicoes = array("i", [SEM_TRANSICAO]) * (len(self.nomes) * len(self.simbolos))
+        visao = TransicoesCompactas(self)
+        for chave, destino in itens:
+            visao[chave] = destino
+        self._compilado = None
+
+    # Compila direto do array, sem passar pelo dicionário de transições
+    def compilar(self, forcar=False):
+        if self._compilado is None or forcar:
+            n, k = len(self.nomes), len(self.simbolos)
+            tabela = [
+                [n if destino == SEM_TRANSICAO else destino for destino in self.transicoes[i * k:(i + 1) * k]]
+                for i in range(n)
+            ]
+            tabela.append([n] * k)
+            finais = [bool(self.ehFinal(i)) for i in range(n)] + [False]
+            inicial = n if self.inicial == SEM_TRANSICAO else self.inicial
+
+            compilado = AfdCompilado.deTabela(list(self.nomes), list(self.simbolos), range(k), tabela, finais, inicial)
+            compilado.compactarAlfabeto()
+            self._compilado = compilado
+        return self._compilado
+
+
+# Visão de dicionário (estado, símbolo) -> estado sobre o array de transições
+class TransicoesCompactas(MutableMapping):
+    __slots__ = ("afd",)
+
+    def __init__(self, afd):
+        self.afd = afd
+
+    def __getitem__(self, chave):
+        afd = self.afd
+        estado, simbolo = chave
+        i, c = afd.id_estado.get(estado), afd.id_simbolo.get(simbolo)
+        if i is None or c is None or afd.transicoes[i * len(afd.simbolos) + c] == SEM_TRANSICAO:
+            raise KeyError(chave)
+        return afd.nomes[afd.transicoes[i * len(afd.simbolos) + c]]
+
+    # Destino None equivale a não ter transição
+    def __setitem__(self, chave, destino):
+        afd = self.afd
+        estado, simbolo = chave
+        c = afd.internarSimbolo(simbolo)
+        i = afd.internarEstado(estado)
+        d = SEM_TRANSICAO if destino is None else afd.internarEstado(destino)
+        afd.transicoes[i * len(afd.simbolos) + c] = d
+        afd._compilado = None
+
+    def __delitem__(self, chave):
+        self[chave]  # KeyError se não existir
+        self[chave] = None
+
+    # Percorre o array uma vez (items() fica com o ItemsView do MutableMapping)
+    def pares(self):
+        afd = self.afd
+        k = len(afd.simbolos)
+        for posicao, destino in enumerate(afd.transicoes):
+            if destino != SEM_TRANSICAO:
+                yield (afd.nomes[posicao // k], afd.simbolos[posicao % k]), afd.nomes[destino]
+
+    def __iter__(self):
+        for chave, _ in self.pares():
+            yield chave
+
+    def __len__(self):
+        return len(self.afd.transicoes) - self.afd.transicoes.count(SEM_TRANSICAO)
+
+    def copy(self):
+        return dict(self.pares())
+
+
+# Visão de conjunto dos estados finais sobre o conjunto de bits, em ordem de id
+class FinaisCompactos(Set):
+    __slots__ = ("afd",)
+
+    def __init__(self, afd):
+        self.afd = afd
+
+    def __contains__(self, estado):
+        i = self.afd.id_estado.get(estado)
+        return i is not None and bool(self.afd.ehFinal(i))
+
+    def __iter__(self):
+        afd = self.afd
+        for i, nome in enumerate(afd.nomes):
+            if afd.ehFinal(i):
+                yield nome
+
+    def __len__(self):
+        return int.from_bytes(self.afd.bits_finais, "little").bit_count()
+
+    def __repr__(self):
+        return repr(list(self))
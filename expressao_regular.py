@@ -0,0 +1,276 @@
+# Compilador de expressões regulares para Afd pela construção direta (followpos), sem AFN
+# intermediário. Sintaxe: literais, escapes (\d \w \s \D \W \S \n \t \r e metacaracteres), ".",
+# classes [abc] [a-z] [^...], grupos ( ) e (?: ), alternância |, concatenação, * + ? e {m} {m,} {m,n}.
+# "." e as negações são relativas ao alfabeto informado (padrão: ASCII imprimível). Com alfabeto
+# informado, literais fora dele são erro e \d \w \s e intervalos ficam só com os símbolos dele.
+import string
+
+from main import Afd
+
+ALFABETO_PADRAO = frozenset(string.printable)
+LIMITE_REPETICAO = 1000
+
+ESCAPES_CLASSE = {
+    "d": frozenset(string.digits),
+    "w": frozenset(string.ascii_letters + string.digits + "_"),
+    "s": frozenset(" \t\n\r\f\v"),
+}
+ESCAPES_LITERAIS = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v"}
+
+# Nós da árvore: ("simbolos", frozenset), ("vazio",), ("concat", [nós]), ("uniao", [nós]), ("estrela", nó)
+VAZIO = ("vazio",)
+
+
+# Analisador descendente recursivo que monta a árvore sintática
+class AnalisadorRegex:
+    # fechado: o universo é o alfabeto do Afd e nenhum símbolo pode ficar fora dele
+    def __init__(self, padrao, universo, fechado=False):
+        self.padrao = padrao
+        self.universo = universo
+        self.fechado = fechado
+        self.posicao = 0
+
+    def erro(self, mensagem):
+        raise ValueError(f"{mensagem} na posição {self.posicao} de {self.padrao!r}")
+
+    def atual(self):
+        return self.padrao[self.posicao] if self.posicao < len(self.padrao) else None
+
+    def consumir(self):
+        caractere = self.atual()
+        if caractere is None:
+            self.erro("Fim inesperado da expressão")
+        self.posicao += 1
+        return caractere
+
+    def analisar(self):
+        arvore = self.expressao()
+        if self.atual() is not None:
+            self.erro(f"Caractere inesperado {self.atual()!r}")
+        return arvore
+
+    # expressao := termo ('|' termo)*
+    def expressao(self):
+        alternativas = [self.termo()]
+        while self.atual() == "|":
+            self.posicao += 1
+            alternativas.append(self.termo())
+        return alternativas[0] if len(alternativas) == 1 else ("uniao", alternativas)
+
+    # termo := fator*
+    def termo(self):
+        fatores = []
+        while self.atual() is not None and self.atual() not in "|)":
+            fatores.append(self.fator())
+        if not fatores:
+            return VAZIO
+        return fatores[0] if len(fatores) == 1 else ("concat", fatores)
+
+    # fator := atomo quantificador*
+    # Um átomo com no máximo um quantificador ("a+?", "a**" e "a{2}*" são rejeitados)
+    def fator(self):
+        no = self.atomo()
+        if self.atual() is None or self.atual() not in "*+?{":
+            return no
+        quantificador = self.consumir()
+        if quantificador == "*":
+            no = ("estrela", no)
+        elif quantificador == "+":
+            no = ("concat", [no, ("estrela", no)])
+        elif quantificador == "?":
+            no = ("uniao", [no, VAZIO])
+        else:
+            no = self.repeticao(no)
+        if self.atual() is not None and self.atual() in "*+?{":
+            self.erro(f"Quantificador {self.atual()!r} logo após outro quantificador")
+        return no
+
+    # X{m} = X..X, X{m,} = X..X X*, X{m,n} = X..X (X?)..(X?)
+    def repeticao(self, no):
+        minimo = self.numero()
+        maximo = minimo
+        if self.atual() == ",":
+            self.posicao += 1
+            maximo = None if self.atual() == "}" else self.numero()
+        if self.consumir() != "}":
+            self.erro("Esperado '}'")
+        if maximo is not None and maximo < minimo:
+            self.erro("Repetição com máximo menor que o mínimo")
+        if max(minimo, maximo or 0) > LIMITE_REPETICAO:
+            self.erro(f"Repetição acima de {LIMITE_REPETICAO}")
+
+        partes = [no] * minimo
+        if maximo is None:
+            partes.append(("estrela", no))
+        else:
+            partes.extend([("uniao", [no, VAZIO])] * (maximo - minimo))
+        if not partes:
+            return VAZIO
+        return partes[0] if len(partes) == 1 else ("concat", partes)
+
+    def numero(self):
+        inicio = self.posicao
+        while self.atual() is not None and self.atual().isdigit():
+            self.posicao += 1
+        if inicio == self.posicao:
+            self.erro("Esperado um número")
+        return int(self.padrao[inicio:self.posicao])
+
+    def atomo(self):
+        caractere = self.consumir()
+        if caractere == "(":
+            if self.padrao.startswith("?:", self.posicao):
+                self.posicao += 2
+            no = self.expressao()
+            if self.consumir() != ")":
+                self.erro("Esperado ')'")
+            return no
+        if caractere == "[":
+            return ("simbolos", self.classe())
+        if caractere == ".":
+            return ("simbolos", self.universo)
+        if caractere == "\\":
+            return ("simbolos", self.noAlfabeto(self.escape()))
+        if caractere in "*+?{":
+            self.erro(f"Quantificador {caractere!r} sem operando")
+        if caractere == ")":
+            self.erro("')' sem '(' correspondente")
+        return ("simbolos", self.noAlfabeto(frozenset(caractere)))
+
+    # Literais precisam pertencer ao alfabeto informado
+    def noAlfabeto(self, simbolos):
+        if self.fechado and not simbolos <= self.universo:
+            fora = min(simbolos - self.universo)
+            self.erro(f"Símbolo {fora!r} fora do alfabeto")
+        return simbolos
+
+    def escape(self):
+        caractere = self.consumir()
+        if caractere in ESCAPES_CLASSE:
+            conjunto = ESCAPES_CLASSE[caractere]
+            return conjunto & self.universo if self.fechado else conjunto
+        if caractere.lower() in ESCAPES_CLASSE:
+            return self.universo - ESCAPES_CLASSE[caractere.lower()]
+        return frozenset(ESCAPES_LITERAIS.get(caractere, caractere))
+
+    # Conteúdo de [...], já consumido o '['
+    def classe(self):
+        negada = self.atual() == "^"
+        if negada:
+            self.posicao += 1
+
+        simbolos = set()
+        primeiro = True
+        while primeiro or self.atual() != "]":
+            primeiro = False
+            caractere = self.consumir()
+            if caractere == "\\":
+                escapado = self.atual()
+                conjunto = self.escape()
+                if escapado in ESCAPES_CLASSE or escapado.lower() in ESCAPES_CLASSE:
+                    simbolos |= conjunto
+                    continue
+                (caractere,) = conjunto
+            if self.atual() == "-" and self.padrao[self.posicao + 1:self.posicao + 2] not in ("]", ""):
+                self.posicao += 1
+                fim = self.consumir()
+                if fim == "\\":
+                    (fim,) = self.escape()
+                if ord(fim) < ord(caractere):
+                    self.erro("Intervalo inválido na classe")
+                intervalo = frozenset(chr(c) for c in range(ord(caractere), ord(fim) + 1))
+                simbolos |= intervalo & self.universo if self.fechado else intervalo
+            else:
+                simbolos |= self.noAlfabeto(frozenset(caractere))
+        self.posicao += 1
+
+        return self.universo - simbolos if negada else frozenset(simbolos)
+
+
+# Numera as folhas (posições) e calcula nullable/firstpos/lastpos/followpos
+class Posicoes:
+    def __init__(self):
+        self.simbolos = []   # posição -> conjunto de símbolos que ela lê
+        self.followpos = []  # posição -> conjunto de posições seguintes
+
+    def nova(self, simbolos):
+        self.simbolos.append(simbolos)
+        self.followpos.append(set())
+        return len(self.simbolos) - 1
+
+    # Retorna (nullable, firstpos, lastpos) do nó
+    def visitar(self, no):
+        tipo = no[0]
+        if tipo == "simbolos":
+            p = self.nova(no[1])
+            return False, {p}, {p}
+        if tipo == "vazio":
+            return True, set(), set()
+        if tipo == "estrela":
+            _, first, last = self.visitar(no[1])
+            for p in last:
+                self.followpos[p] |= first
+            return True, first, last
+        if tipo == "uniao":
+            nullable, first, last = False, set(), set()
+            for filho in no[1]:
+                n, f, l = self.visitar(filho)
+                nullable |= n
+                first |= f
+                last |= l
+            return nullable, first, last
+
+        # Concatenação n-ária: o last acumulado aponta para o first de cada filho seguinte
+        nullable, first, last = True, set(), set()
+        for filho in no[1]:
+            n, f, l = self.visitar(filho)
+            for p in last:
+                self.followpos[p] |= f
+            if nullable:
+                first |= f
+            last = last | l if n else l
+            nullable &= n
+        return nullable, first, last
+
+
+# Compila a expressão em um Afd mínimo; "alfabeto" define o universo de "." e das negações
+def compilarRegex(padrao, alfabeto=None):
+    universo = frozenset(alfabeto) if alfabeto is not None else ALFABETO_PADRAO
+    arvore = AnalisadorRegex(padrao, universo, fechado=alfabeto is not None).analisar()
+
+    # Expressão aumentada com o marcador de fim "#": estados que o contêm são finais
+    posicoes = Posicoes()
+    arvore = ("concat", [arvore, ("simbolos", frozenset())])
+    _, inicial, _ = posicoes.visitar(arvore)
+    marcador = len(posicoes.simbolos) - 1
+
+    alfabeto_afd = sorted(set().union(*posicoes.simbolos)) if alfabeto is None else list(alfabeto)
+
+    inicial = frozenset(inicial)
+    nomes = {inicial: "q0"}
+    pendentes = [inicial]
+    estados_finais = []
+    func_transicao = {}
+
+    while pendentes:
+        conjunto = pendentes.pop()
+        nome = nomes[conjunto]
+        if marcador in conjunto:
+            estados_finais.append(nome)
+
+        # Agrupa os followpos por símbolo lido
+        destinos = {}
+        for p in conjunto:
+            for simbolo in posicoes.simbolos[p]:
+                destinos.setdefault(simbolo, set()).update(posicoes.followpos[p])
+
+        for simbolo, destino in destinos.items():
+            destino = frozenset(destino)
+            if destino not in nomes:
+                nomes[destino] = f"q{len(nomes)}"
+                pendentes.append(destino)
+            func_transicao[(nome, simbolo)] = nomes[destino]
+
+    afd = Afd(list(nomes.values()), alfabeto_afd, "q0", estados_finais)
+    afd.func_transicao = func_transicao
+    return afd.minimizar()
@@ -0,0 +1,404 @@
+# Minimização incremental: a partição em classes de equivalência é mantida entre as edições.
+# A linguagem a partir de um estado só depende dos estados que ele alcança, então uma edição em "e"
+# só pode mudar a classe dos estados que alcançam "e". Só esses estados são reparticionados: de baixo
+# para cima pela assinatura de um passo (finalidade e bloco de destino por símbolo) e, nos ciclos,
+# por Hopcroft junto com os blocos alcançados e um percurso conjunto com blocos candidatos.
+from collections import deque
+
+from main import Afd
+
+
+class MinimizacaoIncremental:
+    # Recebe um Afd comum (listas e dicionário). As edições devem passar por esta classe, que altera
+    # o próprio afd e registra o que mudou.
+    def __init__(self, afd):
+        self.afd = afd
+        self.finais = set(afd.estados_finais)
+
+        # Índice inverso: destino -> conjunto de (origem, símbolo)
+        self.entradas = {}
+        for (estado, simbolo), destino in afd.func_transicao.items():
+            if destino is not None:
+                self.entradas.setdefault(destino, set()).add((estado, simbolo))
+
+        self.particionar()
+
+    # Partição completa, do zero (também usada quando a atualização local não basta)
+    def particionar(self):
+        self.bloco_de = {}
+        self.membros = {}
+        self.proximo_bloco = 0
+        for bloco in self.afd.particaoHopcroft():
+            self.novoBloco(bloco)
+        for estado in self.afd.estados:
+            if estado not in self.bloco_de:
+                self.novoBloco([estado])
+
+        # Registro assinatura -> bloco. Na partição mais grossa dois blocos nunca têm a mesma
+        # assinatura (finalidade e bloco de destino por símbolo), então ela identifica o bloco.
+        self.registro = {}
+        self.assinatura_bloco = {}
+        for b in self.membros:
+            self.registrar(b)
+        self.sujos = set()
+
+    def novoBloco(self, estados):
+        b = self.proximo_bloco
+        self.proximo_bloco += 1
+        self.membros[b] = dict.fromkeys(estados)
+        for estado in estados:
+            self.bloco_de[estado] = b
+        return b
+
+    def registrar(self, b):
+        assinatura = self.assinaturaEstado(next(iter(self.membros[b])))
+        self.registro[assinatura] = b
+        self.assinatura_bloco[b] = assinatura
+
+    # Assinatura de um estado, ou None se algum destino ainda não tem bloco
+    def assinaturaEstado(self, estado):
+        destinos = []
+        for simbolo in self.afd.alfabeto:
+            destino = self.afd.func_transicao.get((estado, simbolo))
+            if destino is None:
+                continue
+            b = self.bloco_de.get(destino)
+            if b is None:
+                return None
+            destinos.append((simbolo, b))
+        return estado in self.finais, frozenset(destinos)
+
+    # Tira o estado do seu bloco; um bloco que fica vazio sai também do registro
+    def retirar(self, estado):
+        b = self.bloco_de.pop(estado)
+        del self.membros[b][estado]
+        if not self.membros[b]:
+            del self.membros[b]
+            assinatura = self.assinatura_bloco.pop(b, None)
+            if self.registro.get(assinatura) == b:
+                del self.registro[assinatura]
+
+    def adicionarEstado(self, estado):
+        if estado not in self.bloco_de:
+            self.afd.estados.append(estado)
+            self.afd.invalidarCompilado()
+            self.novoBloco([estado])
+            self.sujos.add(estado)
+
+    # Cria, redireciona ou (com destino None) remove a transição
+    def definirTransicao(self, estado, simbolo, destino):
+        self.adicionarEstado(estado)
+        if destino is not None:
+            self.adicionarEstado(destino)
+        if simbolo not in self.afd.alfabeto:
+            # Um símbolo novo leva todos os estados ao morto: nenhuma classe muda por causa dele
+            self.afd.alfabeto.append(simbolo)
+            self.afd.invalidarCompilado()
+
+        anterior = self.afd.func_transicao.get((estado, simbolo))
+        if anterior == destino:
+            return
+        if anterior is not None:
+            self.entradas[anterior].discard((estado, simbolo))
+        if destino is None:
+            self.afd.func_transicao.pop((estado, simbolo), None)
+        else:
+            self.afd.func_transicao[(estado, simbolo)] = destino
+            self.entradas.setdefault(destino, set()).add((estado, simbolo))
+        self.afd.invalidarCompilado()
+        self.sujos.add(estado)
+
+    def removerTransicao(self, estado, simbolo):
+        self.definirTransicao(estado, simbolo, None)
+
+    def definirFinal(self, estado, final=True):
+        self.adicionarEstado(estado)
+        if (estado in self.finais) == final:
+            return
+        if final:
+            self.finais.add(estado)
+            self.afd.estados_finais.append(estado)
+        else:
+            self.finais.discard(estado)
+            self.afd.estados_finais.remove(estado)
+        self.afd.invalidarCompilado()
+        self.sujos.add(estado)
+
+    # O estado inicial não entra na partição; só muda o AFD devolvido por minimo
+    def definirInicial(self, estado):
+        self.adicionarEstado(estado)
+        self.afd.estado_inicial = estado
+        self.afd.invalidarCompilado()
+
+    # Estados que alcançam algum estado editado (busca para trás pelo índice inverso)
+    def afetados(self):
+        afetados = set(self.sujos)
+        pilha = list(self.sujos)
+        while pilha:
+            estado = pilha.pop()
+            for origem, _ in self.entradas.get(estado, ()):
+                if origem not in afetados:
+                    afetados.add(origem)
+                    pilha.append(origem)
+        return afetados
+
+    # Reparticiona os estados afetados; devolve quantos foram reprocessados
+    def atualizar(self):
+        if not self.sujos:
+            return 0
+        afetados = self.afetados()
+        for estado in afetados:
+            self.retirar(estado)
+
+        # De baixo para cima: um estado cujos destinos já têm bloco é resolvido pela assinatura
+        # (entra no bloco registrado ou cria um novo). Só sobram os estados em ciclos entre afetados.
+        fila = deque(afetados)
+        while fila:
+            estado = fila.popleft()
+            if estado in self.bloco_de:
+                continue
+            assinatura = self.assinaturaEstado(estado)
+            if assinatura is None:
+                continue
+            b = self.registro.get(assinatura)
+            if b is None:
+                self.registrar(self.novoBloco([estado]))
+            else:
+                self.membros[b][estado] = None
+                self.bloco_de[estado] = b
+            fila.extend(
+                origem for origem, _ in self.entradas.get(estado, ())
+                if origem in afetados and origem not in self.bloco_de
+            )
+
+        restantes = {estado for estado in afetados if estado not in self.bloco_de}
+        if restantes and not self.resolverCiclos(restantes):
+            # Região fechada, sem caminho até um bloco conhecido: refaz a partição inteira
+            self.particionar()
+            return len(self.afd.estados)
+
+        self.sujos.clear()
+        return len(afetados)
+
+    # Estados em ciclos: particiona-os junto com os blocos que alcançam e compara as classes novas
+    # com os demais blocos. Devolve False se alguma classe não alcança nenhum bloco conhecido.
+    def resolverCiclos(self, restantes):
+        pendentes = dict(enumerate(self.particaoReduzida(restantes)))
+        classe_de = {estado: i for i, classe in pendentes.items() for estado in classe}
+        sem_registro = []
+
+        # Quando uma classe ganha bloco, as classes que levam a ela voltam para a fila
+        fila = deque(pendentes)
+        while pendentes:
+            if not fila:
+                # Sobraram classes em ciclos entre si: procura um bloco equivalente
+                i = next(iter(pendentes))
+                mapa = self.equivalenteExistente(i, pendentes, classe_de)
+                if mapa is None:
+                    return False
+                if mapa:
+                    resolvidos = [e for c in mapa for e in pendentes[c]]
+                    self.juntar(mapa, pendentes)
+                else:
+                    resolvidos = pendentes[i]
+                    sem_registro.append(self.novoBloco(pendentes.pop(i)))
+            else:
+                i = fila.popleft()
+                if i not in pendentes:
+                    continue
+                assinatura = self.assinaturaEstado(pendentes[i][0])
+                if assinatura is None:
+                    continue
+                resolvidos = pendentes[i]
+                b = self.registro.get(assinatura)
+                if b is None:
+                    self.registrar(self.novoBloco(pendentes.pop(i)))
+                else:
+                    self.juntar({i: b}, pendentes)
+
+            fila.extend(
+                classe_de[origem]
+                for estado in resolvidos
+                for origem, _ in self.entradas.get(estado, ())
+                if classe_de.get(origem) in pendentes
+            )
+
+        for b in sem_registro:
+            self.registrar(b)
+        return True
+
+    def juntar(self, mapa, pendentes):
+        for i, b in mapa.items():
+            for estado in pendentes.pop(i):
+                self.membros[b][estado] = None
+                self.bloco_de[estado] = b
+
+    # Particiona os estados junto com os blocos que eles alcançam (cada bloco entra como um estado,
+    # com as transições de um membro qualquer). As classes que caem num bloco entram nele; as demais
+    # são devolvidas e são distintas entre si e de todos os blocos alcançados.
+    def particaoReduzida(self, restantes):
+        func_transicao = self.afd.func_transicao
+        alfabeto = self.afd.alfabeto
+
+        def no(destino):
+            if destino is None:
+                return None
+            if destino in restantes:
+                return ("estado", destino)
+            return ("bloco", self.bloco_de[destino])
+
+        estados = [("estado", e) for e in restantes]
+        finais = [("estado", e) for e in restantes if e in self.finais]
+        transicoes = {}
+        vistos = set()
+        pendentes = []
+        for estado in restantes:
+            for simbolo in alfabeto:
+                destino = no(func_transicao.get((estado, simbolo)))
+                if destino is not None:
+                    transicoes[(("estado", estado), simbolo)] = destino
+                    if destino[0] == "bloco" and destino[1] not in vistos:
+                        vistos.add(destino[1])
+                        pendentes.append(destino[1])
+        while pendentes:
+            b = pendentes.pop()
+            representante = next(iter(self.membros[b]))
+            estados.append(("bloco", b))
+            if representante in self.finais:
+                finais.append(("bloco", b))
+            for simbolo in alfabeto:
+                destino = no(func_transicao.get((representante, simbolo)))
+                if destino is not None:
+                    transicoes[(("bloco", b), simbolo)] = destino
+                    if destino[1] not in vistos:
+                        vistos.add(destino[1])
+                        pendentes.append(destino[1])
+
+        reduzido = Afd(estados, alfabeto, None, finais)
+        reduzido.func_transicao = transicoes
+
+        # Blocos já são distintos entre si; cada classe tem no máximo um deles
+        novas = []
+        for classe in reduzido.particaoHopcroft():
+            antigos = [b for tipo, b in classe if tipo == "bloco"]
+            membros = [e for tipo, e in classe if tipo == "estado"]
+            if not membros:
+                continue
+            if antigos:
+                for estado in membros:
+                    self.membros[antigos[0]][estado] = None
+                    self.bloco_de[estado] = antigos[0]
+            else:
+                novas.append(membros)
+        return novas
+
+    # Procura um bloco equivalente à classe pendente i (que só pode ser um bloco não alcançado por
+    # ela). Candidatos: blocos que, pela mesma palavra, chegam ao primeiro bloco conhecido alcançado
+    # por i. Devolve o mapa classe -> bloco da região, {} se não há equivalente ou None se i não
+    # alcança nenhum bloco conhecido.
+    def equivalenteExistente(self, i, pendentes, classe_de):
+        func_transicao = self.afd.func_transicao
+        anterior = {i: None}  # classe -> (classe anterior, símbolo) no caminho a partir de i
+        fila = deque([i])
+        alvo = None
+        while fila and alvo is None:
+            c = fila.popleft()
+            for simbolo in self.afd.alfabeto:
+                destino = func_transicao.get((pendentes[c][0], simbolo))
+                if destino is None:
+                    continue
+                if destino in self.bloco_de:
+                    alvo = self.bloco_de[destino], c, simbolo
+                    break
+                proxima = classe_de[destino]
+                if proxima not in anterior:
+                    anterior[proxima] = (c, simbolo)
+                    fila.append(proxima)
+        if alvo is None:
+            return None
+
+        bloco, c, simbolo = alvo
+        palavra = [simbolo]
+        while anterior[c] is not None:
+            c, simbolo = anterior[c]
+            palavra.append(simbolo)
+
+        candidatos = {bloco}
+        for simbolo in palavra:
+            candidatos = {
+                self.bloco_de[origem]
+                for b in candidatos
+                for membro in self.membros[b]
+                for origem, s in self.entradas.get(membro, ())
+                if s == simbolo and origem in self.bloco_de
+            }
+
+        for candidato in candidatos:
+            mapa = self.verificar(i, candidato, pendentes, classe_de)
+            if mapa is not None:
+                return mapa
+        return {}
+
+    # Percorre a classe i e o bloco b juntos; devolve o mapa classe -> bloco se forem equivalentes
+    def verificar(self, i, b, pendentes, classe_de):
+        func_transicao = self.afd.func_transicao
+        mapa = {i: b}
+        pilha = [i]
+        while pilha:
+            c = pilha.pop()
+            estado, outro = pendentes[c][0], next(iter(self.membros[mapa[c]]))
+            if (estado in self.finais) != (outro in self.finais):
+                return None
+            for simbolo in self.afd.alfabeto:
+                destino = func_transicao.get((estado, simbolo))
+                destino_outro = func_transicao.get((outro, simbolo))
+                if destino is None or destino_outro is None:
+                    if destino is not destino_outro:
+                        return None
+                    continue
+                # Destino do bloco ainda pendente: é um bloco criado agora, distinto da classe
+                esperado = self.bloco_de.get(destino_outro)
+                if esperado is None:
+                    return None
+                if destino in self.bloco_de:
+                    if self.bloco_de[destino] != esperado:
+                        return None
+                    continue
+                proxima = classe_de[destino]
+                if proxima not in mapa:
+                    mapa[proxima] = esperado
+                    pilha.append(proxima)
+                elif mapa[proxima] != esperado:
+                    return None
+        return mapa
+
+    # Novo AFD mínimo (só os blocos alcançáveis a partir do inicial); o afd editado não muda
+    def minimo(self):
+        self.atualizar()
+        afd = self.afd
+        if afd.estado_inicial is None:
+            return Afd([], list(afd.alfabeto), None, [])
+
+        inicial = self.bloco_de[afd.estado_inicial]
+        representante = {inicial: afd.estado_inicial}
+        pendentes = [inicial]
+        estados, finais, transicoes = [], [], {}
+        while pendentes:
+            b = pendentes.pop()
+            rep = representante[b]
+            estados.append(rep)
+            if rep in self.finais:
+                finais.append(rep)
+            for simbolo in afd.alfabeto:
+                destino = afd.func_transicao.get((rep, simbolo))
+                if destino is None:
+                    continue
+                d = self.bloco_de[destino]
+                if d not in representante:
+                    representante[d] = next(iter(self.membros[d]))
+                    pendentes.append(d)
+                transicoes[(rep, simbolo)] = representante[d]
+
+        minimo = Afd(estados, list(afd.alfabeto), afd.estado_inicial, finais)
+        minimo.func_transicao = transicoes
+        return minimo
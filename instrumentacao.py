@@ -0,0 +1,125 @@
+# Instrumentação opcional das operações do Afd. Desligada (ativa é None), cada método instrumentado
+# só consulta esta variável uma vez por chamada; ligada, os contadores (estados e transições
+# produzidos, iterações de refinamento...) e os tempos por fase vão para um objeto Estatisticas e,
+# se houver, para um callback(tipo, nome, valor) com tipo "contador" ou "fase".
+#
+#   with instrumentar() as estatisticas:
+#       afd.uniao(outro).minimizar()
+#   print(estatisticas.resumo())
+#
+#   with perfilar(memoria=True) as perfil:
+#       Afd.carregarAFD("data/grande.jff")
+#   print(perfil.relatorio())
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ativa = None
+
+
+class Estatisticas:
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.limpar()
+
+    def limpar(self):
+        self.contadores = {}
+        self.tempos = {}    # fase -> segundos acumulados
+        self.chamadas = {}  # fase -> quantas vezes foi medida
+
+    def contar(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+        if self.callback is not None:
+            self.callback("contador", nome, quantidade)
+
+    # Acumula na fase o tempo decorrido desde "inicio" (um valor de time.perf_counter())
+    def fase(self, nome, inicio):
+        duracao = time.perf_counter() - inicio
+        self.tempos[nome] = self.tempos.get(nome, 0.0) + duracao
+        self.chamadas[nome] = self.chamadas.get(nome, 0) + 1
+        if self.callback is not None:
+            self.callback("fase", nome, duracao)
+
+    def resumo(self):
+        linhas = [f"{'fase':<32} {'chamadas':>9} {'total (s)':>11}"]
+        for nome, total in sorted(self.tempos.items(), key=lambda item: -item[1]):
+            linhas.append(f"{nome:<32} {self.chamadas[nome]:>9} {total:>11.4f}")
+        linhas.append(f"{'contador':<32} {'valor':>21}")
+        for nome, valor in sorted(self.contadores.items()):
+            linhas.append(f"{nome:<32} {valor:>21}")
+        return "\n".join(linhas)
+
+
+# Liga a instrumentação globalmente (por exemplo, num serviço) e devolve as estatísticas em uso
+def ativar(estatisticas=None, callback=None):
+    global ativa
+    ativa = estatisticas if estatisticas is not None else Estatisticas(callback)
+    return ativa
+
+
+# Desliga e devolve as estatísticas que estavam ativas
+def desativar():
+    global ativa
+    anterior, ativa = ativa, None
+    return anterior
+
+
+# Liga a instrumentação só dentro do bloco (restaurando a anterior na saída)
+@contextmanager
+def instrumentar(estatisticas=None, callback=None):
+    global ativa
+    anterior = ativa
+    ativa = estatisticas if estatisticas is not None else Estatisticas(callback)
+    try:
+        yield ativa
+    finally:
+        ativa = anterior
+
+
+# Resultado de perfilar: estatísticas do cProfile e, com memoria=True, pico e instantâneo do tracemalloc
+class Perfil:
+    def __init__(self):
+        self.estatisticas = None
+        self.pico_memoria = None
+        self.instantaneo = None
+
+    def relatorio(self, linhas=20, ordenar="cumulative"):
+        partes = []
+        if self.estatisticas is not None:
+            saida = io.StringIO()
+            self.estatisticas.stream = saida
+            self.estatisticas.sort_stats(ordenar).print_stats(linhas)
+            partes.append(saida.getvalue())
+        if self.instantaneo is not None:
+            partes.append(f"Pico de memória: {self.pico_memoria / 2**20:.2f} MiB")
+            for estatistica in self.instantaneo.statistics("lineno")[:linhas]:
+                partes.append(str(estatistica))
+        return "\n".join(partes)
+
+
+# Liga o cProfile e/ou o tracemalloc só para as operações dentro do bloco
+@contextmanager
+def perfilar(cprofile=True, memoria=False):
+    perfil = Perfil()
+    perfilador = cProfile.Profile() if cprofile else None
+    iniciou_memoria = memoria and not tracemalloc.is_tracing()
+    if iniciou_memoria:
+        tracemalloc.start()
+    if memoria:
+        tracemalloc.reset_peak()
+    if perfilador is not None:
+        perfilador.enable()
+    try:
+        yield perfil
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+            perfil.estatisticas = pstats.Stats(perfilador)
+        if memoria:
+            perfil.pico_memoria = tracemalloc.get_traced_memory()[1]
+            perfil.instantaneo = tracemalloc.take_snapshot()
+            if iniciou_memoria:
+                tracemalloc.stop()
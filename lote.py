@@ -0,0 +1,82 @@
+# Aceitação em lote com NumPy: todas as cadeias avançam juntas, uma coluna por vez
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; só este módulo depende dele
+    np = None
+
+
+class LoteNumpy:
+    # Aceita um Afd ou um AfdCompilado (por exemplo, carregado com AfdCompilado.carregarBinario)
+    def __init__(self, afd):
+        if np is None:
+            raise ImportError("LoteNumpy requer o NumPy (pip install numpy).")
+
+        compilado = afd.compilar() if hasattr(afd, "compilar") else afd
+        self.compilado = compilado
+        k = len(compilado.classes)
+
+        # Colunas extras: k = preenchimento (mantém o estado), k + 1 = símbolo desconhecido (estado morto)
+        self.col_preenchimento = k
+        self.col_desconhecido = k + 1
+        n = compilado.morto + 1
+        matriz = np.empty((n, k + 2), dtype=np.int32)
+        if compilado.buffer is not None:
+            tabela = np.frombuffer(compilado.buffer, dtype=np.int32)
+        else:
+            tabela = np.asarray(compilado.tabela, dtype=np.int32)
+        matriz[:, :k] = tabela.reshape(n, k)
+        matriz[:, k] = np.arange(n, dtype=np.int32)
+        matriz[:, k + 1] = compilado.morto
+        self.matriz = matriz
+        self.finais = np.asarray(compilado.finais, dtype=bool)
+
+        # Tabela de consulta por código (str de 1 caractere ou byte) -> coluna;
+        # a última posição é "desconhecido" e recebe todos os códigos maiores
+        self.caracteres = all(isinstance(s, str) and len(s) == 1 for s in compilado.simbolos)
+        if self.caracteres:
+            maior = max((ord(s) for s in compilado.simbolos), default=0)
+            self.consulta = np.full(max(maior, 255) + 2, self.col_desconhecido, dtype=np.int32)
+            for simbolo, c in compilado.simbolo_para_id.items():
+                self.consulta[ord(simbolo)] = c
+
+    # Converte as cadeias em uma matriz (cadeias x posições) de índices de coluna
+    def codificar(self, cadeias):
+        cadeias = list(cadeias)
+        tamanhos = np.fromiter((len(c) for c in cadeias), dtype=np.int64, count=len(cadeias))
+        largura = int(tamanhos.max()) if len(cadeias) else 0
+        matriz = np.full((len(cadeias), largura), self.col_preenchimento, dtype=np.int32)
+        # Posições válidas de cada linha; o restante fica como preenchimento
+        mascara = np.arange(largura) < tamanhos[:, None]
+
+        if self.caracteres and all(isinstance(c, str) for c in cadeias):
+            codigos = np.frombuffer("".join(cadeias).encode("utf-32-le"), dtype=np.uint32)
+            matriz[mascara] = self.consulta[np.minimum(codigos, len(self.consulta) - 1)]
+            return matriz
+
+        if self.caracteres and all(isinstance(c, (bytes, bytearray)) for c in cadeias):
+            codigos = np.frombuffer(b"".join(cadeias), dtype=np.uint8)
+            matriz[mascara] = self.consulta[codigos]
+            return matriz
+
+        # Caso geral (símbolos com mais de um caractere, listas de símbolos). Bytes seguem
+        # classesPorByte, como em AfdCompilado.executarBytes
+        simbolo_para_id = self.compilado.simbolo_para_id
+        por_byte = [self.col_desconhecido if c is None else c for c in self.compilado.classesPorByte()]
+        for i, c in enumerate(cadeias):
+            if isinstance(c, (bytes, bytearray, memoryview)):
+                matriz[i, :len(c)] = [por_byte[b] for b in c]
+            else:
+                matriz[i, :len(c)] = [simbolo_para_id.get(s, self.col_desconhecido) for s in c]
+        return matriz
+
+    # Avança todos os estados juntos e retorna os estados finais alcançados
+    def executar(self, codificadas):
+        estados = np.full(codificadas.shape[0], self.compilado.inicial, dtype=np.int32)
+        matriz = self.matriz
+        for j in range(codificadas.shape[1]):
+            estados = matriz[estados, codificadas[:, j]]
+        return estados
+
+    # Vetor booleano de aceitação
+    def aceitar(self, cadeias):
+        return self.finais[self.executar(self.codificar(cadeias))]
@@ -1,9 +1,20 @@
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+from xml.sax.saxutils import escape, quoteattr
 from collections import deque
+from array import array
+import hashlib
+import mmap
+import struct
+import sys
+import time
+
+import instrumentacao
+
 
 # Estrutura do AFD
 class Afd:
+    __slots__ = ("estados", "alfabeto", "func_transicao", "estado_inicial", "estados_finais", "_compilado")
+
     # Construtor
     def __init__(self, estados, alfabeto, estado_inicial, estados_finais):
         self.estados = estados
@@ -11,6 +22,7 @@ class Afd:
         self.func_transicao = {}
         self.estado_inicial = estado_inicial
         self.estados_finais = estados_finais
+        self._compilado = None
 
     # Permite ao usuário criar na hora o AFD
     def configurarAFD(self):
@@ -33,77 +45,107 @@ class Afd:
 
         return afd1
 
-    # Salva afd no formato xml utilizado no jflap
-    def salvarAFD(self, nome_arquivo):
-        estrutura = ET.Element("structure")
-        ET.SubElement(estrutura, "type").text = "fa"
-        afd_element = ET.SubElement(estrutura, "automaton")
+    # Salva afd no formato xml utilizado no jflap; "destino" é um caminho ou um arquivo aberto (texto)
+    def salvarAFD(self, destino, indentar=True):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+        if hasattr(destino, "write"):
+            self.escreverJFLAP(destino, indentar)
+        else:
+            with open(destino, "w", encoding="utf-8") as f:
+                self.escreverJFLAP(f, indentar)
+        if medidor:
+            medidor.fase("salvarAFD", inicio)
+            medidor.contar("salvarAFD.estados", len(self.estados))
+            medidor.contar("salvarAFD.transicoes", len(self.func_transicao))
+
+    # Escreve o xml direto no arquivo, elemento por elemento, sem montar a árvore em memória
+    def escreverJFLAP(self, arquivo, indentar=True):
+        if indentar:
+            nl, i1, i2, i3 = "\n", "  ", "    ", "      "
+        else:
+            nl = i1 = i2 = i3 = ""
+        escrever = arquivo.write
+
+        escrever(f'<?xml version="1.0" ?>{nl}<structure>{nl}{i1}<type>fa</type>{nl}{i1}<automaton>{nl}')
 
         identificadores = {estado: str(i) for i, estado in enumerate(self.estados)}
+        finais = set(self.estados_finais)
 
         for estado in self.estados:
-            estado_element = ET.SubElement(afd_element, "state", id=identificadores[estado], name=estado)
-            ET.SubElement(estado_element, "x").text = "100" # coordenadas fixas para os estados
-            ET.SubElement(estado_element, "y").text = "100"
-
+            # coordenadas fixas para os estados
+            escrever(
+                f'{i2}<state id="{identificadores[estado]}" name={quoteattr(str(estado))}>{nl}'
+                f"{i3}<x>100</x>{nl}{i3}<y>100</y>{nl}"
+            )
             if estado == self.estado_inicial:
-                ET.SubElement(estado_element, "initial")
-            if estado in self.estados_finais:
-                ET.SubElement(estado_element, "final")
+                escrever(f"{i3}<initial/>{nl}")
+            if estado in finais:
+                escrever(f"{i3}<final/>{nl}")
+            escrever(f"{i2}</state>{nl}")
 
         for (estado, simbolo), destino in self.func_transicao.items():
             if destino is None:
                 continue
-            transicao_element = ET.SubElement(afd_element, "transition")
-            ET.SubElement(transicao_element, "from").text = identificadores[estado]
-            ET.SubElement(transicao_element, "to").text = identificadores[destino]
-            ET.SubElement(transicao_element, "read").text = simbolo if simbolo != "" else ""
-
-        xml_str = minidom.parseString(ET.tostring(estrutura, encoding='utf-8'))
-        with open(f"data/{nome_arquivo}", "w", encoding="utf-8") as f:
-            f.write(xml_str.toprettyxml(indent="  "))
-
-    # Lê arquivos xml para jflap
+            leitura = f"<read>{escape(simbolo)}</read>" if simbolo else "<read/>"
+            escrever(
+                f"{i2}<transition>{nl}"
+                f"{i3}<from>{identificadores[estado]}</from>{nl}"
+                f"{i3}<to>{identificadores[destino]}</to>{nl}"
+                f"{i3}{leitura}{nl}"
+                f"{i2}</transition>{nl}"
+            )
+
+        escrever(f"{i1}</automaton>{nl}</structure>{nl}")
+
+    # Lê arquivos xml para jflap (em fluxo: estados e transições entram nas tabelas à medida que são lidos)
     @classmethod
-    def carregarAFD(cls, nome_arquivo):
-        arvore = ET.parse(nome_arquivo)
-        raiz = arvore.getroot()
-        automato = raiz.find("automaton")
-
-        estados = []
-        estado_inicial = None
-        estados_finais = []
-        id_para_nome = {}
-
-        # Lê os estados
-        for estado in automato.findall("state"):
-            nome = estado.attrib["name"]
-            id_estado = estado.attrib["id"]
-            id_para_nome[id_estado] = nome
-            estados.append(nome)
-
-            if estado.find("initial") is not None:
-                estado_inicial = nome
-            if estado.find("final") is not None:
-                estados_finais.append(nome)
-
-        # Alfabeto e função de transição
-        alfabeto = set()
-        func_transicao = {}
-
-        for transicao in automato.findall("transition"):
-            origem = id_para_nome[transicao.find("from").text]
-            destino = id_para_nome[transicao.find("to").text]
-            simbolo_elem = transicao.find("read")
-            simbolo = simbolo_elem.text if simbolo_elem is not None else ""
-            alfabeto.add(simbolo) # verifica simbolos usados e adiciona ao alfabeto
-            func_transicao[(origem, simbolo)] = destino
-
-        afd = cls(estados, list(alfabeto), estado_inicial, estados_finais)
+    def carregarAFD(cls, nome_arquivo, tamanho_bloco=1 << 16):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+        leitor = LeitorJFLAP.ler(nome_arquivo, tamanho_bloco)
+        if medidor:
+            medidor.fase("carregarAFD.xml", inicio)
+            inicio = time.perf_counter()
+        func_transicao = leitor.tabelaTransicoes()
+        if medidor:
+            medidor.fase("carregarAFD.tabela", inicio)
+            medidor.contar("carregarAFD.estados", len(leitor.estados))
+            medidor.contar("carregarAFD.transicoes", len(func_transicao))
+
+        # Arquivos com transições vazias ou mais de um destino por (estado, símbolo) são AFNs
+        if not leitor.deterministico:
+            raise ValueError(f"{nome_arquivo} descreve um AFN; use Afn.carregarAFN(...).determinizar().")
+
+        afd = cls(leitor.estados, list(leitor.alfabeto), leitor.estado_inicial, leitor.estados_finais)
         afd.func_transicao = func_transicao
 
         return afd
 
+    # Salva o AFD no formato binário compacto (ver AfdCompilado.salvarBinario)
+    def salvarBinario(self, destino):
+        if hasattr(destino, "write"):
+            self.compilar().salvarBinario(destino)
+        else:
+            with open(destino, "wb") as f:
+                self.compilar().salvarBinario(f)
+
+    # Lê um AFD salvo com salvarBinario
+    @classmethod
+    def carregarBinario(cls, nome_arquivo):
+        return AfdCompilado.carregarBinario(nome_arquivo).paraAfd(cls)
+
+    # Conversões .jff <-> binário (nomes, símbolos, finais e transições são preservados)
+    @classmethod
+    def converterJffParaBinario(cls, origem, destino):
+        cls.carregarAFD(origem).salvarBinario(destino)
+
+    @classmethod
+    def converterBinarioParaJff(cls, origem, destino, indentar=True):
+        cls.carregarBinario(origem).salvarAFD(destino, indentar)
+
     # Printa a estrutura do AFD
     def printaAFD(self):
         print("Estados         :", self.estados)
@@ -115,8 +157,14 @@ class Afd:
         for chave, valor in self.func_transicao.items():
             print(f"{chave} -> {valor}")
 
-    # Executa o AFD com uma cadeia
-    def testarAFD(self, cadeia):
+    # Executa o AFD com uma cadeia (depurar=True mostra o passo a passo). Bytes são lidos como os
+    # caracteres latin-1 de mesmo código, como em AfdCompilado.executarBytes
+    def testarAFD(self, cadeia, depurar=False):
+        if not depurar:
+            return self.accepts(cadeia)
+        if isinstance(cadeia, (bytes, bytearray, memoryview)):
+            cadeia = bytes(cadeia).decode("latin-1")
+
         estado_atual = self.estado_inicial
 
         for simbolo in cadeia:
@@ -135,15 +183,51 @@ class Afd:
 
         return estado_atual in self.estados_finais
 
-    # verifica estados alcançáveis
+    # Compila o AFD em uma tabela densa de inteiros, cacheada até a próxima alteração feita pelos
+    # métodos do Afd; quem edita os atributos diretamente chama invalidarCompilado() em seguida
+    def compilar(self, forcar=False):
+        if self._compilado is None or forcar:
+            medidor = instrumentacao.ativa
+            if medidor:
+                inicio = time.perf_counter()
+            self._compilado = AfdCompilado(self)
+            if medidor:
+                medidor.fase("compilar", inicio)
+        return self._compilado
+
+    # Descarta a tabela compilada; chamar após editar estados, alfabeto, func_transicao,
+    # estado_inicial ou estados_finais diretamente (no lugar ou por atribuição)
+    def invalidarCompilado(self):
+        self._compilado = None
+
+    # Verifica silenciosamente se a cadeia é aceita
+    def accepts(self, cadeia):
+        return self.compilar().accepts(cadeia)
+
+    # Verifica silenciosamente uma coleção de cadeias
+    def accepts_many(self, cadeias):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+            resultado = self.compilar().accepts_many(cadeias)
+            medidor.fase("accepts_many", inicio)
+            medidor.contar("accepts_many.cadeias", len(resultado))
+            return resultado
+        return self.compilar().accepts_many(cadeias)
+
+    # Cria um reconhecedor incremental; vários fluxos podem compartilhar a mesma tabela compilada
+    def fluxo(self):
+        return AfdFluxo(self.compilar())
+
+    # verifica estados alcançáveis (busca iterativa sobre a tabela compilada)
     def buscaProfundidade(self, estado, visitados):
-        if visitados[estado]:
+        compilado = self.compilar()
+        if estado not in compilado.estado_para_id:
             return
-        visitados[estado] = True
-        for simbolo in self.alfabeto:
-            proximo = self.func_transicao.get((estado, simbolo))
-            if proximo and not visitados[proximo]:
-                self.buscaProfundidade(proximo, visitados)
+        alcancados = compilado.alcancaveis([compilado.estado_para_id[estado]])
+        for nome, i in compilado.estado_para_id.items():
+            if alcancados[i] and nome in visitados:
+                visitados[nome] = True
 
     # Faz a verificação dos nós alcançáveis
     def verificarConexao(self):
@@ -151,29 +235,56 @@ class Afd:
         self.buscaProfundidade(self.estado_inicial, visitados)
         return visitados
 
-    # Faz a remoção dos estados desconexos
-    def removeDesconexos(self):
+    # Estados a partir dos quais algum estado final é alcançável
+    def verificarCoAlcancaveis(self):
+        compilado = self.compilar()
+        uteis = compilado.coAlcancaveis()
+        ids = compilado.estado_para_id
+        return {estado: bool(uteis[ids[estado]]) for estado in self.estados}
+
+    # Faz a remoção dos estados desconexos (e, com remover_mortos=True, dos que não levam a um final)
+    def removeDesconexos(self, remover_mortos=False):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
         visitados = self.verificarConexao()
+        if remover_mortos:
+            co_alcancaveis = self.verificarCoAlcancaveis()
+            visitados = {
+                estado: acessivel and (co_alcancaveis[estado] or estado == self.estado_inicial)
+                for estado, acessivel in visitados.items()
+            }
 
         # Mantém apenas os estados visitados
         estados_acessiveis = [estado for estado, acessivel in visitados.items() if acessivel]
+        acessiveis = set(estados_acessiveis)
         func_transicao_filtrada = {
             (estado, simbolo): destino
             for (estado, simbolo), destino in self.func_transicao.items()
-            if estado in estados_acessiveis and destino in estados_acessiveis
+            if estado in acessiveis and destino in acessiveis
         }
-        estados_finais_filtrados = [estado for estado in self.estados_finais if estado in estados_acessiveis]
+        estados_finais_filtrados = [estado for estado in self.estados_finais if estado in acessiveis]
+
+        if medidor:
+            medidor.fase("removeDesconexos", inicio)
+            medidor.contar("removeDesconexos.removidos", len(self.estados) - len(estados_acessiveis))
 
         # Atualiza o AFD
         self.estados = estados_acessiveis
         self.func_transicao = func_transicao_filtrada
         self.estados_finais = estados_finais_filtrados
+        self._compilado = None
 
     # Busca em profundidade para verificação de conexao do AFD
     def buscaEstadosEquivalentes(self):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
         estados = self.estados
         n = len(estados)
         tabela = {}
+        simbolos = self.representantesDeClasse()
+        finais = set(self.estados_finais)
 
         # Inicializa a tabela de distinção
         for i in range(n):
@@ -181,104 +292,129 @@ class Afd:
                 e1, e2 = estados[i], estados[j]
 
                 # Marca como distinguível se apenas um é final
-                distinguivel = (e1 in self.estados_finais) != (e2 in self.estados_finais)
+                distinguivel = (e1 in finais) != (e2 in finais)
                 tabela[(e1, e2)] = distinguivel
 
+        iteracoes = 0
         alterado = True
         while alterado:
+            iteracoes += 1
             alterado = False
             for i in range(n):
                 for j in range(i):
                     e1, e2 = estados[i], estados[j]
                     if tabela[(e1, e2)]:
                         continue
-                    for simbolo in self.alfabeto:
+                    for simbolo in simbolos:
                         d1 = self.func_transicao.get((e1, simbolo))
                         d2 = self.func_transicao.get((e2, simbolo))
                         if d1 == d2:
                             continue
-                        par = tuple(sorted((d1, d2)))
-                        if d1 is None or d2 is None or tabela.get(par, False):
+                        # A tabela guarda cada par em uma só ordem (a da lista de estados)
+                        if d1 is None or d2 is None or tabela.get((d1, d2), False) or tabela.get((d2, d1), False):
                             tabela[(e1, e2)] = True
                             alterado = True
                             break
 
         # Retorna pares equivalentes
         equivalentes = [(e1, e2) for (e1, e2), marcados in tabela.items() if not marcados]
+        if medidor:
+            medidor.fase("buscaEstadosEquivalentes", inicio)
+            medidor.contar("buscaEstadosEquivalentes.iteracoes", iteracoes)
+            medidor.contar("buscaEstadosEquivalentes.pares", len(tabela))
         return equivalentes
 
-    # Retorna um novo AFD resultado da união entre os AFDs
-    def uniao(self, outro):
-        if set(self.alfabeto) != set(outro.alfabeto):
-            raise ValueError("Os AFDs devem ter o mesmo alfabeto.")
-
-        novo_alfabeto = self.alfabeto
-        novo_estados = []
-        nova_func_transicao = {}
-        novos_finais = []
-
-        for e1 in self.estados:
-            for e2 in outro.estados:
-                novo_estado = (e1, e2)
-                novo_estados.append(novo_estado)
-
-                for simbolo in novo_alfabeto:
-                    d1 = self.func_transicao.get((e1, simbolo))
-                    d2 = outro.func_transicao.get((e2, simbolo))
-                    if d1 is not None and d2 is not None:
-                        nova_func_transicao[(novo_estado, simbolo)] = (d1, d2)
-
-                # Finais se ao menos um é final
-                if e1 in self.estados_finais or e2 in outro.estados_finais:
-                    novos_finais.append(novo_estado)
+    # Constrói sob demanda o produto dos AFDs, gerando só os estados alcançáveis a partir do inicial.
+    # "vivo" recebe as flags de estado morto de cada componente e decide se a transição existe;
+    # "criterio" recebe as flags de estado final e decide se o estado do produto é final.
+    def produto(self, outros, criterio, vivo):
+        for outro in outros:
+            if set(self.alfabeto) != set(outro.alfabeto):
+                raise ValueError("Os AFDs devem ter o mesmo alfabeto.")
+
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+        compilados = [afd.compilar() for afd in (self, *outros)]
+        alfabeto = self.alfabeto
+
+        # Símbolos com a mesma classe em todos os operandos levam ao mesmo estado do produto
+        grupos = {}
+        for simbolo in alfabeto:
+            chave = tuple(c.simbolo_para_id.get(simbolo) for c in compilados)
+            grupos.setdefault(chave, []).append(simbolo)
+
+        inicial = tuple(c.inicial for c in compilados)
+        indice = {inicial: 0}
+        ordem = [inicial]
+        fila = deque([inicial])
+        transicoes = []
+
+        while fila:
+            atual = fila.popleft()
+            origem = indice[atual]
+            for chave, simbolos in grupos.items():
+                proximo = tuple(
+                    c.morto if col is None else c.tabela[e][col]
+                    for c, col, e in zip(compilados, chave, atual)
+                )
+                if not vivo([e == c.morto for c, e in zip(compilados, proximo)]):
+                    continue
+                destino = indice.get(proximo)
+                if destino is None:
+                    destino = indice[proximo] = len(ordem)
+                    ordem.append(proximo)
+                    fila.append(proximo)
+                transicoes.extend((origem, simbolo, destino) for simbolo in simbolos)
+
+        # Componentes mortos aparecem como None no nome do estado
+        nomes = [
+            tuple(None if e == c.morto else c.nomes_estados[e] for c, e in zip(compilados, estado))
+            for estado in ordem
+        ]
+        finais = [
+            nome for nome, estado in zip(nomes, ordem)
+            if criterio([c.finais[e] for c, e in zip(compilados, estado)])
+        ]
 
         afd_resultado = Afd(
-            estados=novo_estados,
-            alfabeto=novo_alfabeto,
-            estado_inicial=(self.estado_inicial, outro.estado_inicial),
-            estados_finais=novos_finais
+            estados=nomes,
+            alfabeto=alfabeto,
+            estado_inicial=nomes[0],
+            estados_finais=finais
         )
 
-        afd_resultado.func_transicao = nova_func_transicao
+        afd_resultado.func_transicao = {(nomes[o], simbolo): nomes[d] for o, simbolo, d in transicoes}
+        if medidor:
+            medidor.fase("produto", inicio)
+            medidor.contar("produto.estados", len(nomes))
+            medidor.contar("produto.transicoes", len(transicoes))
         return afd_resultado
 
-    # Retorna um novo AFD resultado da intersecao entre os AFDs
-    def intersecao(self, outro):
-        if set(self.alfabeto) != set(outro.alfabeto):
-            raise ValueError("Os AFDs devem ter o mesmo alfabeto.")
-
-        novo_alfabeto = self.alfabeto
-        novo_estados = []
-        nova_func_transicao = {}
-        novos_finais = []
-
-        for e1 in self.estados:
-            for e2 in outro.estados:
-                novo_estado = (e1, e2)
-                novo_estados.append(novo_estado)
-
-                for simbolo in novo_alfabeto:
-                    d1 = self.func_transicao.get((e1, simbolo))
-                    d2 = outro.func_transicao.get((e2, simbolo))
-                    if d1 is not None and d2 is not None:
-                        nova_func_transicao[(novo_estado, simbolo)] = (d1, d2)
-
-                # Estado final na interseção: ambos precisam ser finais
-                if e1 in self.estados_finais and e2 in outro.estados_finais:
-                    novos_finais.append(novo_estado)
+    # Um símbolo do alfabeto por classe (símbolos da mesma classe levam sempre aos mesmos estados)
+    def representantesDeClasse(self):
+        simbolo_para_id = self.compilar().simbolo_para_id
+        representantes = {}
+        for simbolo in self.alfabeto:
+            representantes.setdefault(simbolo_para_id.get(simbolo), simbolo)
+        return list(representantes.values())
 
-        afd_resultado = Afd(
-            estados=novo_estados,
-            alfabeto=novo_alfabeto,
-            estado_inicial=(self.estado_inicial, outro.estado_inicial),
-            estados_finais=novos_finais
-        )
+    # Retorna um novo AFD resultado da união entre os AFDs
+    def uniao(self, *outros):
+        # Segue enquanto ao menos um componente estiver vivo; final se ao menos um é final
+        return self.produto(outros, criterio=any, vivo=lambda mortos: not all(mortos))
 
-        afd_resultado.func_transicao = nova_func_transicao
-        return afd_resultado
+    # Retorna um novo AFD resultado da intersecao entre os AFDs
+    def intersecao(self, *outros):
+        # Estado final na interseção: todos precisam ser finais
+        return self.produto(outros, criterio=all, vivo=lambda mortos: not any(mortos))
 
     # Retorna um novo AFD complemento ao AFD utilizado
     def complemento(afd):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+
         # Verifica se o AFD é completo; se não for, completa com um estado de erro
         estado_erro = "ERRO"
         novo_func_transicao = afd.func_transicao.copy()
@@ -295,8 +431,9 @@ class Afd:
             novo_func_transicao[(estado_erro, simbolo)] = estado_erro
         novos_estados.add(estado_erro)
 
-        # Inverte os estados finais
-        novos_estados_finais = [estado for estado in novos_estados if estado not in afd.estados_finais]
+        # Inverte os estados finais (conjunto: afd.estados_finais pode ser uma lista ou uma visão)
+        finais = set(afd.estados_finais)
+        novos_estados_finais = [estado for estado in novos_estados if estado not in finais]
 
         # Cria o novo AFD com o complemento
         complemento = Afd(
@@ -306,286 +443,1181 @@ class Afd:
             estados_finais = novos_estados_finais
         )
         complemento.func_transicao = novo_func_transicao
+        if medidor:
+            medidor.fase("complemento", inicio)
+            medidor.contar("complemento.estados", len(novos_estados))
+            medidor.contar("complemento.transicoes", len(novo_func_transicao))
 
         return complemento
 
-    # Retorna um novo AFD da diferença entre os AFDs
-    def diferenca(self, outro):
-        if set(self.alfabeto) != set(outro.alfabeto):
-            raise ValueError("Os AFDs devem ter o mesmo alfabeto.")
+    # Retorna um novo AFD da diferença entre os AFDs (self menos todos os outros)
+    def diferenca(self, *outros):
+        # Equivale a intersecao com o complemento dos outros, sem construir o complemento
+        return self.produto(
+            outros,
+            criterio=lambda finais: finais[0] and not any(finais[1:]),
+            vivo=lambda mortos: not mortos[0]
+        )
 
-        complemento_outro = outro.complemento()
-        return self.intersecao(complemento_outro)
+    # Particiona os estados em classes de equivalência pelo algoritmo de Hopcroft (O(n·k·log n))
+    def particaoHopcroft(self):
+        compilado = self.compilar()
+        tabela = compilado.tabela
+        morto = compilado.morto
+        k = len(compilado.classes)
+        total = morto + 1
+
+        # Índice inverso: predecessores[c][t] = estados que vão para t lendo o símbolo c
+        predecessores = [[[] for _ in range(total)] for _ in range(k)]
+        for origem in range(total):
+            linha = tabela[origem]
+            for c in range(k):
+                predecessores[c][linha[c]].append(origem)
+
+        # Partição inicial: finais, não finais e o estado morto (transição ausente distingue estados,
+        # como em buscaEstadosEquivalentes)
+        finais = {e for e in range(morto) if compilado.finais[e]}
+        nao_finais = set(range(morto)) - finais
+        blocos = [bloco for bloco in (finais, nao_finais, {morto}) if bloco]
+        bloco_de = [0] * total
+        for i, bloco in enumerate(blocos):
+            for e in bloco:
+                bloco_de[e] = i
+
+        # Lista de divisores (bloco, símbolo); todos os blocos menos o maior bastam
+        maior = max(range(len(blocos)), key=lambda i: len(blocos[i]))
+        pendentes = [(i, c) for i in range(len(blocos)) if i != maior for c in range(k)]
+
+        divisores = 0
+        while pendentes:
+            divisores += 1
+            divisor, c = pendentes.pop()
+            inversos = predecessores[c]
+
+            # Agrupa por bloco os estados que chegam ao divisor lendo c
+            atingidos = {}
+            for destino in blocos[divisor]:
+                for origem in inversos[destino]:
+                    atingidos.setdefault(bloco_de[origem], []).append(origem)
+
+            for b, membros in atingidos.items():
+                bloco = blocos[b]
+                if len(membros) == len(bloco):
+                    continue
+
+                # A parte menor vira um bloco novo; o antigo fica com a maior
+                parte = set(membros)
+                if 2 * len(parte) > len(bloco):
+                    parte = bloco - parte
+                bloco -= parte
+                novo = len(blocos)
+                blocos.append(parte)
+                for e in parte:
+                    bloco_de[e] = novo
+
+                # Basta acrescentar o bloco novo: se o antigo já estava pendente continua,
+                # e se não estava o novo é a metade menor
+                pendentes.extend((novo, d) for d in range(k))
+
+        medidor = instrumentacao.ativa
+        if medidor:
+            medidor.contar("particaoHopcroft.divisores", divisores)
+            medidor.contar("particaoHopcroft.blocos", len(blocos) - 1)
+
+        nomes = compilado.nomes_estados
+        return [[nomes[e] for e in bloco] for bloco in blocos if morto not in bloco]
+
+    # Agrupa em classes os pares equivalentes encontrados pela tabela de pares
+    def particaoPorTabela(self):
+        classe = {estado: {estado} for estado in self.estados}
+        for e1, e2 in self.buscaEstadosEquivalentes():
+            if classe[e1] is not classe[e2]:
+                unida = classe[e1] | classe[e2]
+                for e in unida:
+                    classe[e] = unida
+
+        vistos = set()
+        blocos = []
+        for estado in self.estados:
+            if id(classe[estado]) not in vistos:
+                vistos.add(id(classe[estado]))
+                blocos.append([e for e in self.estados if e in classe[estado]])
+        return blocos
+
+    # Remove estados desnecessários (metodo="hopcroft" ou "tabela" para o algoritmo de pares)
+    def minimizar(self, metodo="hopcroft"):
+        medidor = instrumentacao.ativa
+        if medidor:
+            medidor.contar("minimizar.estados_antes", len(self.estados))
+            inicio = time.perf_counter()
 
-    # Remove estados desnecessários (retorna novo AFD minimizado)
-    def minimizar(self):
         # Remove estados não alcançáveis
         self.removeDesconexos()
 
-        # Encontra estados equivalentes
-        equivalentes = self.buscaEstadosEquivalentes()
-
-        # Mapeia estados para seus representantes (merge de equivalentes)
-        representante = {estado: estado for estado in self.estados}
-        for e1, e2 in equivalentes:
-            rep = min(e1, e2)  # Pode usar heurística diferente se quiser
-            representante[e1] = rep
-            representante[e2] = rep
+        # Encontra as classes de estados equivalentes
+        if medidor:
+            medidor.fase("minimizar.desconexos", inicio)
+            inicio = time.perf_counter()
+        if metodo == "hopcroft":
+            blocos = self.particaoHopcroft()
+        elif metodo == "tabela":
+            blocos = self.particaoPorTabela()
+        else:
+            raise ValueError(f"Método de minimização desconhecido: {metodo}")
+        if medidor:
+            medidor.fase("minimizar.particao", inicio)
+            inicio = time.perf_counter()
+
+        # Mapeia estados para seus representantes (o inicial representa seu bloco)
+        representante = {}
+        for bloco in blocos:
+            rep = self.estado_inicial if self.estado_inicial in bloco else bloco[0]
+            for estado in bloco:
+                representante[estado] = rep
 
         # Reconstroi conjuntos de estados e transições
-        novos_estados = set(representante.values())
+        novos_estados = list(dict.fromkeys(representante[e] for e in self.estados))
         novo_estado_inicial = representante[self.estado_inicial]
-        novos_estados_finais = list({representante[e] for e in self.estados_finais})
+        novos_estados_finais = list(dict.fromkeys(representante[e] for e in self.estados_finais))
 
         nova_func_transicao = {}
         for (estado, simbolo), destino in self.func_transicao.items():
-            r_origem = representante[estado]
-            r_destino = representante[destino]
-            nova_func_transicao[(r_origem, simbolo)] = r_destino
+            if destino is None:
+                continue
+            nova_func_transicao[(representante[estado], simbolo)] = representante[destino]
 
         # Atualiza AFD com os valores minimizados
-        self.estados = list(novos_estados)
+        self.estados = novos_estados
         self.estado_inicial = novo_estado_inicial
         self.estados_finais = novos_estados_finais
         self.func_transicao = nova_func_transicao
+        self._compilado = None
 
+        if medidor:
+            medidor.fase("minimizar.reconstrucao", inicio)
+            medidor.contar("minimizar.estados_depois", len(novos_estados))
         return self
 
-    # Verifica se dois AFD reconhecem as mesmas linguagens
+    # Igual a minimizar, mas devolve um novo AFD e mantém este intacto
+    def minimo(self, metodo="hopcroft"):
+        return self.copia().minimizar(metodo)
+
+    # Verifica se dois AFD reconhecem as mesmas linguagens (nomes de estados não importam)
     def verificarEquivalencia(self, outro):
-        # Verifica se os alfabetos são os mesmos
-        if set(self.alfabeto) != set(outro.alfabeto):
-            return False
+        return self.contraExemplo(outro) is None
+
+    # Retorna a menor cadeia (lista de símbolos) aceita por um AFD e rejeitada pelo outro,
+    # ou None se as linguagens forem iguais. Usa o algoritmo de Hopcroft–Karp com union-find,
+    # que para assim que encontra um par de estados com aceitação diferente.
+    def contraExemplo(self, outro):
+        medidor = instrumentacao.ativa
+        if medidor:
+            inicio = time.perf_counter()
+        a, b = self.compilar(), outro.compilar()
+
+        # Símbolo ausente em um dos AFDs leva ao estado morto dele; basta um símbolo
+        # representante para cada par de classes (a, b)
+        representantes = {}
+        for simbolo in dict.fromkeys([*a.simbolos, *b.simbolos]):
+            representantes.setdefault((a.simbolo_para_id.get(simbolo), b.simbolo_para_id.get(simbolo)), simbolo)
+        colunas = list(representantes)
+        simbolos = list(representantes.values())
+
+        # Os estados de "outro" ocupam ids deslocados no mesmo union-find
+        deslocamento = a.morto + 1
+        pai = list(range(deslocamento + b.morto + 1))
+
+        def raiz(x):
+            while pai[x] != x:
+                pai[x] = pai[pai[x]]
+                x = pai[x]
+            return x
+
+        pai[a.inicial] = b.inicial + deslocamento
+        fila = deque([(a.inicial, b.inicial)])
+        pares = 0
+
+        while fila:
+            p, q = fila.popleft()
+            pares += 1
+            if a.finais[p] != b.finais[q]:
+                cadeia = self.menorContraExemplo(a, b, simbolos, colunas)
+                if medidor:
+                    medidor.fase("contraExemplo", inicio)
+                    medidor.contar("contraExemplo.pares", pares)
+                return cadeia
+
+            linha_a, linha_b = a.tabela[p], b.tabela[q]
+            for ca, cb in colunas:
+                p2 = a.morto if ca is None else linha_a[ca]
+                q2 = b.morto if cb is None else linha_b[cb]
+                r1, r2 = raiz(p2), raiz(q2 + deslocamento)
+                if r1 != r2:
+                    pai[r1] = r2
+                    fila.append((p2, q2))
+
+        if medidor:
+            medidor.fase("contraExemplo", inicio)
+            medidor.contar("contraExemplo.pares", pares)
+        return None
+
+    # Busca em largura no produto dos dois AFDs até o primeiro par com aceitação diferente
+    @staticmethod
+    def menorContraExemplo(a, b, simbolos, colunas):
+        inicio = (a.inicial, b.inicial)
+        anterior = {inicio: None}
+        fila = deque([inicio])
+
+        while fila:
+            par = fila.popleft()
+            p, q = par
+            if a.finais[p] != b.finais[q]:
+                cadeia = []
+                while anterior[par] is not None:
+                    par, simbolo = anterior[par]
+                    cadeia.append(simbolo)
+                return cadeia[::-1]
+
+            for simbolo, (ca, cb) in zip(simbolos, colunas):
+                proximo = (
+                    a.morto if ca is None else a.tabela[p][ca],
+                    b.morto if cb is None else b.tabela[q][cb]
+                )
+                if proximo not in anterior:
+                    anterior[proximo] = (par, simbolo)
+                    fila.append(proximo)
+
+        return None
+
+    # Verifica se o AFD não aceita nenhuma cadeia (nenhum estado final alcançável)
+    def linguagemVazia(self):
+        compilado = self.compilar()
+        if compilado.inicial == compilado.morto:
+            return True
+        alcancaveis = compilado.alcancaveis([compilado.inicial])
+        return not any(alcancaveis[e] and compilado.finais[e] for e in range(compilado.morto))
+
+    # Verifica se o AFD aceita um número finito de cadeias: não há ciclo entre os estados úteis
+    # (ordenação topológica de Kahn no grafo restrito a eles)
+    def linguagemFinita(self):
+        uteis, arestas = self.transicoesUteis()
+        grau = [0] * len(uteis)
+        for lista in arestas:
+            for destino, _ in lista:
+                grau[destino] += 1
+
+        pilha = [i for i, g in enumerate(grau) if g == 0]
+        removidos = 0
+        while pilha:
+            i = pilha.pop()
+            removidos += 1
+            for destino, _ in arestas[i]:
+                grau[destino] -= 1
+                if grau[destino] == 0:
+                    pilha.append(destino)
+        return removidos == len(uteis)
+
+    # Estados úteis (alcançáveis a partir do inicial e que alcançam um final) e, para cada um, a
+    # lista (destino, quantidade de símbolos que levam até ele) restrita aos úteis, por índice
+    def transicoesUteis(self):
+        compilado = self.compilar()
+        if compilado.inicial == compilado.morto:
+            return [], []
+        alcancaveis = compilado.alcancaveis([compilado.inicial])
+        co_alcancaveis = compilado.coAlcancaveis()
+        uteis = [e for e in range(compilado.morto) if alcancaveis[e] and co_alcancaveis[e]]
+
+        indice = {e: i for i, e in enumerate(uteis)}
+        tamanhos = [len(classe) for classe in compilado.classes]
+        arestas = []
+        for estado in uteis:
+            pesos = {}
+            for c, destino in enumerate(compilado.tabela[estado]):
+                i = indice.get(destino)
+                if i is not None:
+                    pesos[i] = pesos.get(i, 0) + tamanhos[c]
+            arestas.append(list(pesos.items()))
+        return uteis, arestas
+
+    # Menor cadeia (lista de símbolos) aceita, ou None se a linguagem for vazia
+    def menorCadeiaAceita(self):
+        return self.menorCadeia(True)
+
+    # Menor cadeia sobre o alfabeto rejeitada, ou None se o AFD aceitar todas
+    def menorCadeiaRejeitada(self):
+        return self.menorCadeia(False)
+
+    # Busca em largura por classe de símbolos até o primeiro estado com a aceitação pedida
+    # (o estado morto conta como não final)
+    def menorCadeia(self, aceita):
+        compilado = self.compilar()
+        representantes = [classe[0] for classe in compilado.classes]
+        anterior = {compilado.inicial: None}
+        fila = deque([compilado.inicial])
+
+        while fila:
+            estado = fila.popleft()
+            if compilado.finais[estado] == aceita:
+                cadeia = []
+                while anterior[estado] is not None:
+                    estado, simbolo = anterior[estado]
+                    cadeia.append(simbolo)
+                return cadeia[::-1]
+
+            for simbolo, destino in zip(representantes, compilado.tabela[estado]):
+                if destino not in anterior:
+                    anterior[destino] = (estado, simbolo)
+                    fila.append(destino)
+
+        return None
+
+    # Quantidade de cadeias aceitas de cada tamanho de 0 até "maximo" (programação dinâmica sobre o
+    # vetor de quantos caminhos chegam a cada estado útil)
+    def contagensPorTamanho(self, maximo):
+        if maximo < 0:
+            raise ValueError("O tamanho máximo deve ser não negativo.")
+        uteis, arestas = self.transicoesUteis()
+        if not uteis:
+            return [0] * (maximo + 1)
+        compilado = self.compilar()
+        finais = [i for i, estado in enumerate(uteis) if compilado.finais[estado]]
+
+        vetor = [0] * len(uteis)
+        vetor[uteis.index(compilado.inicial)] = 1
+        contagens = []
+        for tamanho in range(maximo + 1):
+            contagens.append(sum(vetor[i] for i in finais))
+            if tamanho < maximo:
+                proximo = [0] * len(uteis)
+                for i, quantidade in enumerate(vetor):
+                    if quantidade:
+                        for destino, peso in arestas[i]:
+                            proximo[destino] += quantidade * peso
+                vetor = proximo
+        return contagens
+
+    # Quantidade exata de cadeias aceitas com "tamanho" símbolos. "dp" custa O(tamanho · transições);
+    # "matriz" eleva a matriz de transições à potência por quadrados, O(estados³ · log tamanho), e
+    # serve para tamanhos enormes; "auto" escolhe o mais barato
+    def contarCadeias(self, tamanho, metodo="auto"):
+        if tamanho < 0:
+            raise ValueError("O tamanho deve ser não negativo.")
+        if metodo not in ("auto", "dp", "matriz"):
+            raise ValueError(f"Método de contagem desconhecido: {metodo}")
+        uteis, arestas = self.transicoesUteis()
+        if not uteis:
+            return 0
+
+        if metodo == "auto":
+            custo_dp = tamanho * sum(len(lista) for lista in arestas)
+            custo_matriz = len(uteis) ** 3 * tamanho.bit_length()
+            metodo = "dp" if custo_dp <= custo_matriz else "matriz"
+        if metodo == "dp":
+            return self.contagensPorTamanho(tamanho)[-1]
+
+        compilado = self.compilar()
+        m = len(uteis)
+        matriz = [[0] * m for _ in range(m)]
+        for i, lista in enumerate(arestas):
+            for destino, peso in lista:
+                matriz[i][destino] = peso
+
+        # Vetor linha do estado inicial vezes matriz^tamanho
+        vetor = [[0] * m]
+        vetor[0][uteis.index(compilado.inicial)] = 1
+        while tamanho:
+            if tamanho & 1:
+                vetor = self.multiplicarMatrizes(vetor, matriz)
+            tamanho >>= 1
+            if tamanho:
+                matriz = self.multiplicarMatrizes(matriz, matriz)
+        return sum(vetor[0][i] for i, estado in enumerate(uteis) if compilado.finais[estado])
+
+    # Produto de matrizes de inteiros (listas de linhas), sem limite de tamanho dos números
+    @staticmethod
+    def multiplicarMatrizes(a, b):
+        colunas = list(zip(*b))
+        return [[sum(x * y for x, y in zip(linha, coluna) if x) for coluna in colunas] for linha in a]
+
+    # Gerador preguiçoso das cadeias aceitas (listas de símbolos) em ordem shortlex: por tamanho e,
+    # no mesmo tamanho, em ordem lexicográfica dos símbolos (ordenados por repr, como em formaCanonica).
+    # Cada tamanho é percorrido em profundidade só por estados que ainda alcançam um final com os
+    # símbolos restantes, então nenhum ramo termina sem produzir uma cadeia.
+    def cadeiasAceitas(self, tamanho_maximo=None):
+        uteis, _ = self.transicoesUteis()
+        if not uteis:
+            return
+        # Linguagem finita: nenhuma cadeia aceita passa de len(uteis) - 1 símbolos
+        if self.linguagemFinita():
+            limite = len(uteis) - 1
+            tamanho_maximo = limite if tamanho_maximo is None else min(tamanho_maximo, limite)
+
+        compilado = self.compilar()
+        tabela, morto = compilado.tabela, compilado.morto
+        simbolos = sorted(compilado.simbolo_para_id, key=repr)
+        colunas = [compilado.simbolo_para_id[simbolo] for simbolo in simbolos]
+        classes = range(len(compilado.classes))
+
+        # chega[r][estado]: o estado alcança um final lendo exatamente r símbolos
+        chega = [bytearray(compilado.finais)]
+        tamanho = 0
+        while tamanho_maximo is None or tamanho <= tamanho_maximo:
+            while len(chega) <= tamanho:
+                anterior = chega[-1]
+                chega.append(bytearray(
+                    any(anterior[tabela[e][c]] for c in classes) if e != morto else 0 for e in range(morto + 1)
+                ))
+
+            if chega[tamanho][compilado.inicial]:
+                cadeia = []
+                pilha = [[compilado.inicial, 0]]  # (estado, próximo símbolo a tentar)
+                while pilha:
+                    topo = pilha[-1]
+                    restantes = tamanho - len(cadeia)
+                    if restantes == 0:
+                        yield list(cadeia)
+                        pilha.pop()
+                        if cadeia:
+                            cadeia.pop()
+                        continue
 
-        # Verifica se os estados iniciais são os mesmos
-        if self.estado_inicial != outro.estado_inicial:
-            return False
+                    estado, j = topo
+                    precisa = chega[restantes - 1]
+                    linha = tabela[estado]
+                    while j < len(colunas) and not precisa[linha[colunas[j]]]:
+                        j += 1
+                    if j == len(colunas):
+                        pilha.pop()
+                        if cadeia:
+                            cadeia.pop()
+                        continue
+                    topo[1] = j + 1
+                    cadeia.append(simbolos[j])
+                    pilha.append([linha[colunas[j]], 0])
+            tamanho += 1
+
+    # Cópia independente (mesma classe, listas e dicionário novos)
+    def copia(self):
+        novo = type(self)(list(self.estados), list(self.alfabeto), self.estado_inicial, list(self.estados_finais))
+        novo.func_transicao = dict(self.func_transicao.items())
+        return novo
+
+    # Forma canônica da linguagem: AFD mínimo sem estados mortos, numerado em largura a partir do
+    # inicial com o alfabeto ordenado. Linguagens iguais sobre o mesmo alfabeto dão a mesma forma.
+    def formaCanonica(self):
+        alfabeto = sorted(set(self.alfabeto), key=repr)
+        # Linguagem vazia (inclusive com inicial morto): sempre um único estado não final sem transições
+        if self.estado_inicial is None or self.linguagemVazia():
+            return tuple(alfabeto), ((False, (None,) * len(alfabeto)),)
+
+        minimo = self.copia()
+        minimo.removeDesconexos(remover_mortos=True)
+        minimo.minimizar()
+        finais = set(minimo.estados_finais)
+        transicoes = minimo.func_transicao
+
+        numero = {minimo.estado_inicial: 0}
+        fila = deque([minimo.estado_inicial])
+        linhas = []
+        while fila:
+            estado = fila.popleft()
+            linha = []
+            for simbolo in alfabeto:
+                destino = transicoes.get((estado, simbolo))
+                if destino is not None and destino not in numero:
+                    numero[destino] = len(numero)
+                    fila.append(destino)
+                linha.append(None if destino is None else numero[destino])
+            linhas.append((estado in finais, tuple(linha)))
+        return tuple(alfabeto), tuple(linhas)
+
+    # Hash estrutural (sha256 da forma canônica), guardado na tabela compilada até a próxima alteração
+    def assinatura(self):
+        compilado = self.compilar()
+        if compilado._assinatura is None:
+            compilado._assinatura = hashlib.sha256(repr(self.formaCanonica()).encode("utf-8")).hexdigest()
+        return compilado._assinatura
+
+
+# Alvo do XMLParser para arquivos do JFLAP: nenhum Element é criado, só as tabelas do AFD
+class LeitorJFLAP:
+    def __init__(self):
+        self.estados = []
+        self.estado_inicial = None
+        self.estados_finais = []
+        self.id_para_nome = {}
+        self.alfabeto = {}
+        self.func_transicao = {}
+        self.pendentes = []  # transições que citam estados ainda não declarados
+        self.deterministico = True
+
+        self.atributos = None
+        self.inicial = self.final = False
+        self.campos = {}
+        self.texto = None
+
+    def start(self, tag, atributos):
+        if tag == "state":
+            self.atributos = atributos
+            self.inicial = self.final = False
+        elif tag == "transition":
+            self.campos = {}
+        elif tag in ("from", "to", "read"):
+            self.texto = []
+
+    def data(self, dados):
+        if self.texto is not None:
+            self.texto.append(dados)
+
+    def end(self, tag):
+        if tag in ("from", "to", "read"):
+            # <read/> vazio vira None, como o .text do ElementTree
+            self.campos[tag] = "".join(self.texto) or None
+            self.texto = None
+        elif tag == "initial":
+            self.inicial = True
+        elif tag == "final":
+            self.final = True
+        elif tag == "state":
+            nome = self.atributos["name"]
+            self.id_para_nome[self.atributos["id"]] = nome
+            self.estados.append(nome)
+            if self.inicial:
+                self.estado_inicial = nome
+            if self.final:
+                self.estados_finais.append(nome)
+        elif tag == "transition":
+            simbolo = self.campos.get("read", "")
+            self.alfabeto[simbolo] = None # verifica simbolos usados e adiciona ao alfabeto
+            origem = self.id_para_nome.get(self.campos["from"])
+            destino = self.id_para_nome.get(self.campos["to"])
+            if origem is None or destino is None:
+                self.pendentes.append((self.campos["from"], simbolo, self.campos["to"]))
+            else:
+                self.adicionarTransicao(origem, simbolo, destino)
 
-        # Verifica se os estados finais são os mesmos
-        if set(self.estados_finais) != set(outro.estados_finais):
-            return False
+    def close(self):
+        return self
 
-        # Compara as transições
-        for estado in self.estados:
-            for simbolo in self.alfabeto:
-                destino1 = self.func_transicao.get((estado, simbolo))
-                destino2 = outro.func_transicao.get((estado, simbolo))
+    # <read/> vazio (None) é uma transição vazia (λ) do JFLAP
+    def adicionarTransicao(self, origem, simbolo, destino):
+        anterior = self.func_transicao.get((origem, simbolo))
+        if simbolo is None or (anterior is not None and anterior != destino):
+            self.deterministico = False
+        self.func_transicao[(origem, simbolo)] = destino
+
+    # Resolve as transições pendentes, agora que todos os estados foram lidos
+    def tabelaTransicoes(self):
+        for origem, simbolo, destino in self.pendentes:
+            self.adicionarTransicao(self.id_para_nome[origem], simbolo, self.id_para_nome[destino])
+        self.pendentes = []
+        return self.func_transicao
+
+    # Lê o arquivo em blocos com um leitor desta classe
+    @classmethod
+    def ler(cls, nome_arquivo, tamanho_bloco=1 << 16):
+        leitor = cls()
+        parser = ET.XMLParser(target=leitor)
+
+        with open(nome_arquivo, "rb") as f:
+            while bloco := f.read(tamanho_bloco):
+                parser.feed(bloco)
+        parser.close()
+
+        return leitor
+
+
+CABECALHO_BINARIO = struct.Struct("<4sIIIIII")
+ASSINATURA_BINARIO = b"AFDB"
+VERSAO_BINARIO = 2
+NOME_NULO = 0xFFFFFFFF
+
+
+# Tabela de transição densa: estados e símbolos viram inteiros e o estado morto é explícito.
+# Símbolos com a mesma coluna na tabela são agrupados em classes e dividem uma única coluna:
+# simbolo_para_id leva cada símbolo à coluna da sua classe e classes[c] lista os símbolos dela.
+class AfdCompilado:
+    def __init__(self, afd):
+        self.estado_para_id = {estado: i for i, estado in enumerate(afd.estados)}
+        self.simbolo_para_id = {simbolo: i for i, simbolo in enumerate(afd.alfabeto)}
+
+        # Destinos fora de "estados" também recebem um id
+        for (estado, simbolo), destino in afd.func_transicao.items():
+            for e in (estado, destino):
+                if e is not None and e not in self.estado_para_id:
+                    self.estado_para_id[e] = len(self.estado_para_id)
+            if simbolo not in self.simbolo_para_id:
+                self.simbolo_para_id[simbolo] = len(self.simbolo_para_id)
+
+        self.nomes_estados = list(self.estado_para_id)
+        self.simbolos = list(self.simbolo_para_id)
+        self.morto = len(self.nomes_estados)
+        k = len(self.simbolos)
+
+        # Uma linha por estado; o estado morto leva sempre a ele mesmo
+        self.tabela = [[self.morto] * k for _ in range(self.morto + 1)]
+        for (estado, simbolo), destino in afd.func_transicao.items():
+            if destino is not None:
+                self.tabela[self.estado_para_id[estado]][self.simbolo_para_id[simbolo]] = self.estado_para_id[destino]
+
+        self.compactarAlfabeto()
+
+        self.inicial = self.estado_para_id.get(afd.estado_inicial, self.morto)
+        self.finais = [False] * (self.morto + 1)
+        for estado in afd.estados_finais:
+            if estado in self.estado_para_id:
+                self.finais[self.estado_para_id[estado]] = True
+
+        # Índice inverso e tabela de bytes, construídos só quando alguém precisa deles
+        self._predecessores = None
+        self._bytes_para_id = None
+        self._colunas = None
+        self._assinatura = None
+        self.buffer = None
+
+    # Agrupa os símbolos cujas colunas são idênticas; a tabela passa a ter uma coluna por classe
+    def compactarAlfabeto(self):
+        colunas = list(zip(*self.tabela)) if self.simbolos else []
+        classe_da_coluna = {}
+        coluna_para_classe = [classe_da_coluna.setdefault(coluna, len(classe_da_coluna)) for coluna in colunas]
+
+        self.classes = [[] for _ in classe_da_coluna]
+        for simbolo, c in self.simbolo_para_id.items():
+            self.classes[coluna_para_classe[c]].append(simbolo)
+            self.simbolo_para_id[simbolo] = coluna_para_classe[c]
+
+        if len(classe_da_coluna) < len(colunas):
+            self.tabela = [list(linha) for linha in zip(*classe_da_coluna)]
+
+    # Tabela de 256 posições código -> classe (None se o caractere não está no alfabeto)
+    def classesPorByte(self):
+        if self._bytes_para_id is None:
+            self._bytes_para_id = [self.simbolo_para_id.get(chr(b)) for b in range(256)]
+        return self._bytes_para_id
+
+    # Monta a partir de tabelas prontas (usado pelo carregamento binário)
+    @classmethod
+    def deTabela(cls, nomes_estados, simbolos, classe_dos_simbolos, tabela, finais, inicial):
+        compilado = cls.__new__(cls)
+        compilado.nomes_estados = nomes_estados
+        compilado.simbolos = simbolos
+        compilado.estado_para_id = {estado: i for i, estado in enumerate(nomes_estados)}
+        compilado.simbolo_para_id = dict(zip(simbolos, classe_dos_simbolos))
+        compilado.classes = [[] for _ in range(max(classe_dos_simbolos, default=-1) + 1)]
+        for simbolo, c in compilado.simbolo_para_id.items():
+            compilado.classes[c].append(simbolo)
+        compilado.morto = len(nomes_estados)
+        compilado.tabela = tabela
+        compilado.finais = finais
+        compilado.inicial = inicial
+        compilado._predecessores = None
+        compilado._bytes_para_id = None
+        compilado._colunas = None
+        compilado._assinatura = None
+        compilado.buffer = None
+        return compilado
+
+    # Converte de volta para um Afd com dicionário de transições
+    def paraAfd(self, cls=None):
+        cls = cls or Afd
+        afd = cls(
+            list(self.nomes_estados),
+            list(self.simbolos),
+            None if self.inicial == self.morto else self.nomes_estados[self.inicial],
+            [nome for i, nome in enumerate(self.nomes_estados) if self.finais[i]]
+        )
+        morto = self.morto
+        for i, nome in enumerate(self.nomes_estados):
+            linha = self.tabela[i]
+            for simbolo in self.simbolos:
+                destino = linha[self.simbolo_para_id[simbolo]]
+                if destino != morto:
+                    afd.func_transicao[(nome, simbolo)] = self.nomes_estados[destino]
+        return afd
 
-                # Se uma transição está definida em um AFD e não no outro, ou se as transições não coincidem
-                if destino1 != destino2:
-                    return False
+    # Formato binário (little-endian):
+    #   cabeçalho  "AFDB", versão, nº de estados (n), nº de símbolos (s), nº de classes (k), inicial,
+    #              tamanho dos nomes
+    #   nomes      n + s entradas (u32 tamanho + utf-8); tamanho 0xFFFFFFFF codifica o símbolo None
+    #   classes    s u32: classe (coluna) de cada símbolo
+    #   finais     conjunto de bits com n bits
+    #   transições (n + 1) * k int32, linha a linha; o valor n é o estado morto (última linha)
+    # As seções são alinhadas em 4 bytes para permitir frombuffer direto sobre o arquivo mapeado.
+    def salvarBinario(self, arquivo):
+        n, k = self.morto, len(self.classes)
+
+        nomes = bytearray()
+        for nome in (*self.nomes_estados, *self.simbolos):
+            if nome is None:
+                nomes += struct.pack("<I", NOME_NULO)
+            else:
+                dados = str(nome).encode("utf-8")
+                nomes += struct.pack("<I", len(dados)) + dados
+        nomes += bytes(-len(nomes) % 4)
 
-        return True
+        bits = bytearray((n + 7) // 8)
+        for i in range(n):
+            if self.finais[i]:
+                bits[i >> 3] |= 1 << (i & 7)
+        bits += bytes(-len(bits) % 4)
+
+        transicoes = array("i")
+        for linha in self.tabela:
+            transicoes.extend(linha)
+        if sys.byteorder != "little":
+            transicoes.byteswap()
+
+        classes = array("I", (self.simbolo_para_id[simbolo] for simbolo in self.simbolos))
+        if sys.byteorder != "little":
+            classes.byteswap()
+
+        arquivo.write(CABECALHO_BINARIO.pack(
+            ASSINATURA_BINARIO, VERSAO_BINARIO, n, len(self.simbolos), k, self.inicial, len(nomes)
+        ))
+        arquivo.write(nomes)
+        arquivo.write(classes.tobytes())
+        arquivo.write(bits)
+        arquivo.write(transicoes.tobytes())
+
+    # Carrega com mmap; a tabela de transições é uma visão direta sobre o arquivo, sem cópia
+    @classmethod
+    def carregarBinario(cls, nome_arquivo):
+        with open(nome_arquivo, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.deBuffer(mapa, nome_arquivo)
 
+    # Monta a partir de qualquer buffer no formato binário (mmap, memória compartilhada, bytes)
+    @classmethod
+    def deBuffer(cls, mapa, origem="buffer"):
+        assinatura, versao, n, s, k, inicial, tamanho_nomes = CABECALHO_BINARIO.unpack_from(mapa, 0)
+        if assinatura != ASSINATURA_BINARIO or versao != VERSAO_BINARIO:
+            raise ValueError(f"{origem} não é um AFD binário compatível.")
+
+        posicao = CABECALHO_BINARIO.size
+        nomes = []
+        for _ in range(n + s):
+            (tamanho,) = struct.unpack_from("<I", mapa, posicao)
+            posicao += 4
+            if tamanho == NOME_NULO:
+                nomes.append(None)
+            else:
+                nomes.append(str(bytes(mapa[posicao:posicao + tamanho]), "utf-8"))
+                posicao += tamanho
+        posicao = CABECALHO_BINARIO.size + tamanho_nomes
 
-# MAIN
+        classe_dos_simbolos = struct.unpack_from(f"<{s}I", mapa, posicao)
+        posicao += 4 * s
 
-afd1 = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
-afd2 = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
-afdAux = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
-
-nome_arquivo = "sem nome"
-nome_aux = ""
-
-# Menu inicial
-while 1:
-    if not afd1.estados:
-        print("Sem arquivos carregados ...\n")
-        choice = input(
-            "0 - Sair\n"
-            "1 - Configurar AFD\n"
-            "2 - Importar AFD\n"
-            "=> ")
-    else:
-        print(f"Arquivo {nome_arquivo} carregado ...\n")
-        choice = input(
-            "0 - Sair\n"
-            "1 - Configurar AFD\n"
-            "2 - Importar AFD\n"
-            "3 - salvar AFD\n"
-            "4 - Remover estados inacessíveis AFD\n"
-            "5 - Calcular estados equivalentes AFD\n"
-            "6 - Testar equivalência entre dois AFDs\n"
-            "7 - Complemento do AFD\n"
-            "8 - Minimizar AFD\n"
-            "9 - Operações com AFDs\n"
-            
-            "\n10 - Testar AFDs"
-            "=> ")
+        tamanho_bits = (n + 7) // 8
+        bits = bytes(mapa[posicao:posicao + tamanho_bits])
+        finais = [bool(bits[i >> 3] >> (i & 7) & 1) for i in range(n)] + [False]
+        posicao += tamanho_bits + (-tamanho_bits % 4)
 
-    # SAIR
-    if choice == "0": # SAIR
-        break
+        tamanho_transicoes = (n + 1) * k * 4
+        if sys.byteorder == "little":
+            buffer = memoryview(mapa)[posicao:posicao + tamanho_transicoes].cast("i")
+        else:
+            copia = array("i", bytes(mapa[posicao:posicao + tamanho_transicoes]))
+            copia.byteswap()
+            buffer = memoryview(copia)
+        tabela = [buffer[i * k:(i + 1) * k] for i in range(n + 1)]
+
+        compilado = cls.deTabela(nomes[:n], nomes[n:], classe_dos_simbolos, tabela, finais, inicial)
+        compilado.buffer = buffer  # visão contínua, usada por LoteNumpy
+        compilado._mapa = mapa
+        return compilado
+
+    # Estado (id) alcançado após ler a cadeia a partir de "inicio" (bytes vão para executarBytes,
+    # então accepts, accepts_many e AfdFluxo.feed leem bytes sempre do mesmo jeito)
+    def executar(self, cadeia, inicio=None):
+        if type(cadeia) is not str and isinstance(cadeia, (bytes, bytearray, memoryview)):
+            return self.executarBytes(cadeia, inicio)
+        tabela = self.tabela
+        simbolo_para_id = self.simbolo_para_id
+        morto = self.morto
+        estado = self.inicial if inicio is None else inicio
 
-    # CONFIGURAR
-    elif choice == "1":
-        print("Configurando AFD...")
-        afd2 = afd2.configurarAFD()
+        for simbolo in cadeia:
+            c = simbolo_para_id.get(simbolo)
+            if c is None:
+                return morto
+            estado = tabela[estado][c]
+            if estado == morto:
+                return morto
+
+        return estado
+
+    # Mesmo que executar, mas para bytes: cada byte é lido como o caractere de mesmo código
+    def executarBytes(self, dados, inicio=None):
+        tabela = self.tabela
+        bytes_para_id = self.classesPorByte()
+        morto = self.morto
+        estado = self.inicial if inicio is None else inicio
+
+        for b in dados:
+            c = bytes_para_id[b]
+            if c is None:
+                return morto
+            estado = tabela[estado][c]
+            if estado == morto:
+                return morto
+
+        return estado
+
+    # Função estado -> estado induzida pelo pedaço, calculada para todos os estados de uma vez.
+    # Só os destinos distintos seguem adiante; quando vários estados convergem eles são unidos.
+    def mapaDeTransicao(self, pedaco, intervalo_compactacao=16):
+        morto = self.morto
+        if isinstance(pedaco, (bytes, bytearray, memoryview)):
+            coluna_de = self.classesPorByte().__getitem__
+            executar = self.executarBytes
+        else:
+            coluna_de = self.simbolo_para_id.get
+            executar = self.executar
+
+        # colunas[c][e] = destino de e lendo c (formato que deixa o passo uma só list comprehension)
+        if self._colunas is None:
+            self._colunas = [[linha[c] for linha in self.tabela] for c in range(len(self.classes))]
+        colunas = self._colunas
+
+        ativos = list(range(morto + 1))   # estados distintos em curso
+        posicao = list(range(morto + 1))  # estado de origem -> índice em ativos
+
+        for passo, simbolo in enumerate(pedaco, 1):
+            c = coluna_de(simbolo)
+            if c is None:
+                return [morto] * (morto + 1)
+            coluna = colunas[c]
+            ativos = [coluna[e] for e in ativos]
+
+            if passo % intervalo_compactacao == 0:
+                unicos = {}
+                novo_indice = [unicos.setdefault(e, len(unicos)) for e in ativos]
+                if len(unicos) < len(ativos):
+                    ativos = list(unicos)
+                    posicao = [novo_indice[p] for p in posicao]
+
+                # Só resta um estado vivo (o morto nunca sai de si mesmo): o resto do pedaço
+                # é uma execução comum a partir dele
+                vivos = [e for e in ativos if e != morto]
+                if len(vivos) <= 1:
+                    final = executar(pedaco[passo:], vivos[0]) if vivos else morto
+                    return [morto if ativos[p] == morto else final for p in posicao]
+
+        return [ativos[p] for p in posicao]
+
+    def accepts(self, cadeia):
+        return self.finais[self.executar(cadeia)]
+
+    # Marca (bytearray indexado por id) os estados alcançáveis a partir das origens, sem recursão
+    def alcancaveis(self, origens):
+        tabela = self.tabela
+        visitados = bytearray(self.morto + 1)
+        visitados[self.morto] = 1  # o estado morto nunca entra na busca
+        pilha = []
+        for origem in origens:
+            if not visitados[origem]:
+                visitados[origem] = 1
+                pilha.append(origem)
+
+        while pilha:
+            for proximo in tabela[pilha.pop()]:
+                if not visitados[proximo]:
+                    visitados[proximo] = 1
+                    pilha.append(proximo)
+
+        visitados[self.morto] = 0
+        return visitados
 
-    # IMPORTAR
-    elif choice == "2":
-        nome_arquivo = input("Indique o caminho do arquivo (ex: data/arq.jff): ")
-        afd1 = Afd.carregarAFD(nome_arquivo)
+    # Marca os estados que alcançam algum estado final (busca no grafo invertido)
+    def coAlcancaveis(self):
+        if self._predecessores is None:
+            self._predecessores = [[] for _ in range(self.morto + 1)]
+            for origem in range(self.morto):
+                for destino in set(self.tabela[origem]):
+                    self._predecessores[destino].append(origem)
+
+        predecessores = self._predecessores
+        visitados = bytearray(self.morto + 1)
+        visitados[self.morto] = 1
+        pilha = []
+        for estado in range(self.morto):
+            if self.finais[estado]:
+                visitados[estado] = 1
+                pilha.append(estado)
+
+        while pilha:
+            for anterior in predecessores[pilha.pop()]:
+                if not visitados[anterior]:
+                    visitados[anterior] = 1
+                    pilha.append(anterior)
+
+        visitados[self.morto] = 0
+        return visitados
 
-        print("\nAFD importado com sucesso:")
-        afd1.printaAFD()
+    def accepts_many(self, cadeias):
+        finais = self.finais
+        executar = self.executar
+        return [finais[executar(cadeia)] for cadeia in cadeias]
+
+
+# Reconhecimento incremental: a entrada chega em pedaços (str ou bytes) e só o estado atual é guardado
+class AfdFluxo:
+    def __init__(self, compilado):
+        self.compilado = compilado
+        self.atual = compilado.inicial
+
+    # Volta ao estado inicial para reaproveitar o objeto em outro fluxo
+    def reset(self):
+        self.atual = self.compilado.inicial
+
+    # Consome um pedaço da entrada e retorna se o que foi lido até aqui é aceito
+    def feed(self, pedaco):
+        compilado = self.compilado
+        if self.atual != compilado.morto:
+            self.atual = compilado.executar(pedaco, self.atual)
+        return compilado.finais[self.atual]
+
+    # Consome um iterável de pedaços ou um arquivo (qualquer objeto com read)
+    def consumir(self, fonte, tamanho_bloco=1 << 16):
+        aceita = self.aceita
+        if hasattr(fonte, "read"):
+            while pedaco := fonte.read(tamanho_bloco):
+                aceita = self.feed(pedaco)
+        else:
+            for pedaco in fonte:
+                aceita = self.feed(pedaco)
+        return aceita
 
-    # SALVAR
-    elif choice == "3":
-        nome_arquivo = input("Escolha um nome para o arquivo: ")
-        afd1.salvarAFD(nome_arquivo)
-        print(f"Arquivo salvo como '{nome_arquivo}'...")
+    # Nome do estado atual (None no estado morto)
+    @property
+    def estado(self):
+        if self.atual == self.compilado.morto:
+            return None
+        return self.compilado.nomes_estados[self.atual]
 
-    # REMOVER ESTADOS INACESSIVEIS
-    elif choice == "4":
-        afd1.removeDesconexos()
-        afd1.printaAFD()
+    @property
+    def aceita(self):
+        return self.compilado.finais[self.atual]
 
-    # CALCULAR ESTADOS EQUIVALENTES
-    elif choice == "5":
-        print(f"Estados equivalentes:\n {afd1.buscaEstadosEquivalentes()}")
 
-    # TESTAR EQUIVALENCIA ENTRE AFDs $
-    elif choice == "6":
-        if not afd2.estados:
-            choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
-            if choice == "1":
-                nome_aux = input("Insira o nome do arquivo: ")
-            else:
-                print("Criando AFD para comparação")
-                afd2 = afd2.configurarAFD()
+# MAIN
+if __name__ == "__main__":
+    afd1 = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
+    afd2 = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
+    afdAux = Afd(estados=[], alfabeto=[], estado_inicial=None, estados_finais=[])
+
+    nome_arquivo = "sem nome"
+    nome_aux = ""
+
+    # Menu inicial
+    while 1:
+        if not afd1.estados:
+            print("Sem arquivos carregados ...\n")
+            choice = input(
+                "0 - Sair\n"
+                "1 - Configurar AFD\n"
+                "2 - Importar AFD\n"
+                "=> ")
         else:
-            print("Deseja utilizar esse AFD já carregado?")
-            afd2.printaAFD()
+            print(f"Arquivo {nome_arquivo} carregado ...\n")
+            choice = input(
+                "0 - Sair\n"
+                "1 - Configurar AFD\n"
+                "2 - Importar AFD\n"
+                "3 - salvar AFD\n"
+                "4 - Remover estados inacessíveis AFD\n"
+                "5 - Calcular estados equivalentes AFD\n"
+                "6 - Testar equivalência entre dois AFDs\n"
+                "7 - Complemento do AFD\n"
+                "8 - Minimizar AFD\n"
+                "9 - Operações com AFDs\n"
+            
+                "\n10 - Testar AFDs"
+                "=> ")
+
+        # SAIR
+        if choice == "0": # SAIR
+            break
+
+        # CONFIGURAR
+        elif choice == "1":
+            print("Configurando AFD...")
+            afd2 = afd2.configurarAFD()
 
-            choice = input("\n1 - Sim\n2 - Não\n=> ")
-            if choice == "2":
+        # IMPORTAR
+        elif choice == "2":
+            nome_arquivo = input("Indique o caminho do arquivo (ex: data/arq.jff): ")
+            try:
+                afd1 = Afd.carregarAFD(nome_arquivo)
+            except ValueError:
+                from afn import Afn
+                print("O arquivo descreve um AFN; determinizando e minimizando...")
+                afd1 = Afn.carregarAFN(nome_arquivo).paraAfdMinimo()
+
+            print("\nAFD importado com sucesso:")
+            afd1.printaAFD()
+
+        # SALVAR
+        elif choice == "3":
+            nome_arquivo = input("Escolha um nome para o arquivo: ")
+            afd1.salvarAFD(f"data/{nome_arquivo}")
+            print(f"Arquivo salvo como '{nome_arquivo}'...")
+
+        # REMOVER ESTADOS INACESSIVEIS
+        elif choice == "4":
+            afd1.removeDesconexos()
+            afd1.printaAFD()
+
+        # CALCULAR ESTADOS EQUIVALENTES
+        elif choice == "5":
+            print(f"Estados equivalentes:\n {afd1.buscaEstadosEquivalentes()}")
+
+        # TESTAR EQUIVALENCIA ENTRE AFDs $
+        elif choice == "6":
+            if not afd2.estados:
                 choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
                 if choice == "1":
                     nome_aux = input("Insira o nome do arquivo: ")
-                    afd2.carregarAFD(nome_aux)
                 else:
                     print("Criando AFD para comparação")
                     afd2 = afd2.configurarAFD()
+            else:
+                print("Deseja utilizar esse AFD já carregado?")
+                afd2.printaAFD()
+
+                choice = input("\n1 - Sim\n2 - Não\n=> ")
+                if choice == "2":
+                    choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
+                    if choice == "1":
+                        nome_aux = input("Insira o nome do arquivo: ")
+                        afd2.carregarAFD(nome_aux)
+                    else:
+                        print("Criando AFD para comparação")
+                        afd2 = afd2.configurarAFD()
+
+            contra_exemplo = afd1.contraExemplo(afd2)
+            if contra_exemplo is None:
+                print("Equivalentes...")
+            else:
+                print(f"Não Equivalentes... (contraexemplo: {contra_exemplo})")
 
-        print("Equivalentes..." if afd1.verificarEquivalencia(afd2) else "Não Equivalentes...")
-
-    # Complemento do AFD
-    elif choice == "7":
-        print("Complemento do AFD: ")
-        afdAux = afd1.complemento()
-        afd1.printaAFD()
-
-        choice = input("Deseja salvar esse AFD?\n"
-                       "1 - Sim\n"
-                       "2 - Não\n"
-                       "=> ")
-        if choice == "1":
-            afdAux.salvarAFD(input("Nome ou caminho do arquivo: "))
+        # Complemento do AFD
+        elif choice == "7":
+            print("Complemento do AFD: ")
+            afdAux = afd1.complemento()
+            afd1.printaAFD()
 
-    # Minimizar AFD
-    elif choice == "8":
-        afdAux = afd1.minimizar()
+            choice = input("Deseja salvar esse AFD?\n"
+                           "1 - Sim\n"
+                           "2 - Não\n"
+                           "=> ")
+            if choice == "1":
+                afdAux.salvarAFD(f"data/{input('Nome do arquivo: ')}")
 
-        print("Afd1 - Original: ")
-        afd1.printaAFD()
+        # Minimizar AFD
+        elif choice == "8":
+            afdAux = afd1.minimizar()
 
-        print("\nAfdAux - Afd1 Minimizado: ")
-        afdAux.printaAFD()
+            print("Afd1 - Original: ")
+            afd1.printaAFD()
 
-    # OPERAÇÕES ENTRE AFDs
-    elif choice == "9":
-        if not afd2.estados:
-            choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
-            if choice == "1":
-                nome_aux = input("Insira o nome do arquivo: ")
-            else:
-                print("Criando AFD para comparação")
-                afd2 = afd2.configurarAFD()
-        else:
-            print("Deseja utilizar esse AFD já carregado?")
-            afd2.printaAFD()
+            print("\nAfdAux - Afd1 Minimizado: ")
+            afdAux.printaAFD()
 
-            choice = input("\n1 - Sim\n2 - Não\n=> ")
-            if choice == "2":
+        # OPERAÇÕES ENTRE AFDs
+        elif choice == "9":
+            if not afd2.estados:
                 choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
                 if choice == "1":
                     nome_aux = input("Insira o nome do arquivo: ")
-                    afd2.carregarAFD(nome_aux)
                 else:
                     print("Criando AFD para comparação")
                     afd2 = afd2.configurarAFD()
+            else:
+                print("Deseja utilizar esse AFD já carregado?")
+                afd2.printaAFD()
+
+                choice = input("\n1 - Sim\n2 - Não\n=> ")
+                if choice == "2":
+                    choice = input("\n1 - Importar novo AFD\n2 - Configurar novo AFD\n=> ")
+                    if choice == "1":
+                        nome_aux = input("Insira o nome do arquivo: ")
+                        afd2.carregarAFD(nome_aux)
+                    else:
+                        print("Criando AFD para comparação")
+                        afd2 = afd2.configurarAFD()
+
+            choice = input("Escolha uma operação:"
+                           "0 - Voltar\n"
+                           "1 - União\n"
+                           "2 - Interseção\n"
+                           "3 - Diferença\n"
+                           "=> ")
 
-        choice = input("Escolha uma operação:"
-                       "0 - Voltar\n"
-                       "1 - União\n"
-                       "2 - Interseção\n"
-                       "3 - Diferença\n"
-                       "=> ")
+            if choice == "1":
+                afdAux = afd1.uniao(afd2)
+                print("AFD resultante: ")
+                afdAux.printaAFD()
+
+            elif choice == "2":
+                afdAux = afd1.intersecao(afd2)
+                print("AFD resultante: ")
+                afdAux.printaAFD()
+
+            elif choice == "3":
+                afdAux = afd1.diferenca(afd2)
+                print("AFD resultante: ")
+                afdAux.printaAFD()
+
+        # TESTAR AFD
+        elif choice == "10":
+            choice = input("Qual afd deseja testar?\n"
+                           "1 - Afd1 (padrão)\n"
+                           "2 - Afd2\n"
+                           "3 - AfdAux\n"
+                           "4 - Mostrar AFDs carregados\n"
+                           "=> ")
 
-        if choice == "1":
-            afdAux = afd1.uniao(afd2)
-            print("AFD resultante: ")
-            afdAux.printaAFD()
+            if choice == "1":
+                print("Cadeia Reconhecida..." if afd1.testarAFD(input("Insira a cadeia que deseja verificar: "), depurar=True) else "Cadeia inválida...")
 
-        elif choice == "2":
-            afdAux = afd1.intersecao(afd2)
-            print("AFD resultante: ")
-            afdAux.printaAFD()
+            elif choice == "2":
+                print("Cadeia Reconhecida..." if afd2.testarAFD(input("Insira a cadeia que deseja verificar: "), depurar=True) else "Cadeia inválida...")
 
-        elif choice == "3":
-            afdAux = afd1.diferenca(afd2)
-            print("AFD resultante: ")
-            afdAux.printaAFD()
+            elif choice == "3":
+                print("Cadeia Reconhecida..." if afdAux.testarAFD(input("Insira a cadeia que deseja verificar: "), depurar=True) else "Cadeia inválida...")
 
-    # TESTAR AFD
-    elif choice == "10":
-        choice = input("Qual afd deseja testar?\n"
-                       "1 - Afd1 (padrão)\n"
-                       "2 - Afd2\n"
-                       "3 - AfdAux\n"
-                       "4 - Mostrar AFDs carregados\n"
-                       "=> ")
+            elif choice == "4":
+                print("\nAfd1: ")
+                afd1.printaAFD()
 
-        if choice == "1":
-            print("Cadeia Reconhecida..." if afd1.testarAFD(input("Insira a cadeia que deseja verificar: ")) else "Cadeia inválida...")
+                print("\nAfd2: ")
+                afd1.printaAFD()
 
-        elif choice == "2":
-            print("Cadeia Reconhecida..." if afd2.testarAFD(input("Insira a cadeia que deseja verificar: ")) else "Cadeia inválida...")
+                print("\nAfdAux: ")
+                afd1.printaAFD()
 
-        elif choice == "3":
-            print("Cadeia Reconhecida..." if afdAux.testarAFD(input("Insira a cadeia que deseja verificar: ")) else "Cadeia inválida...")
+        else:
+            exit(1)
 
-        elif choice == "4":
-            print("\nAfd1: ")
-            afd1.printaAFD()
+        input("Pressione Enter para continuar...")
 
-            print("\nAfd2: ")
-            afd1.printaAFD()
+    # Salvar
+    if afd1.estados:
+        afd1.printaAFD()
+        choice = input("\nDeseja salvar o arquivo Afd1? 1 - Sim / 2 - Não : ")
+        if choice == "1":
+            afd1.salvarAFD(f"data/{input('Nome do arquivo: ')}")
 
-            print("\nAfdAux: ")
-            afd1.printaAFD()
+    if afd2.estados:
+        afd2.printaAFD()
+        choice = input("\nDeseja salvar o arquivo Afd2? 1 - Sim / 2 - Não : ")
+        if choice == "1":
+            afd1.salvarAFD(f"data/{input('Nome do arquivo: ')}")
 
-    else:
-        exit(1)
-
-    input("Pressione Enter para continuar...")
-
-# Salvar
-if afd1.estados:
-    afd1.printaAFD()
-    choice = input("\nDeseja salvar o arquivo Afd1? 1 - Sim / 2 - Não : ")
-    if choice == "1":
-        afd1.salvarAFD(input("Nome do arquivo: "))
-
-if afd2.estados:
-    afd2.printaAFD()
-    choice = input("\nDeseja salvar o arquivo Afd2? 1 - Sim / 2 - Não : ")
-    if choice == "1":
-        afd1.salvarAFD(input("Nome do arquivo: "))
-
-if afdAux.estados:
-    afdAux.printaAFD()
-    choice = input("\nDeseja salvar o arquivo AfdAux? 1 - Sim / 2 - Não : ")
-    if choice == "1":
-        afd1.salvarAFD(input("Nome do arquivo: "))
+    if afdAux.estados:
+        afdAux.printaAFD()
+        choice = input("\nDeseja salvar o arquivo AfdAux? 1 - Sim / 2 - Não : ")
+        if choice == "1":
+            afd1.salvarAFD(f"data/{input('Nome do arquivo: ')}")
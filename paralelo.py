@@ -0,0 +1,111 @@
+# Aceitação em lote distribuída entre processos. A tabela compilada vai uma única vez para a
+# memória compartilhada (no formato de salvarBinario); cada processo só recebe o nome do bloco.
+# Uma única cadeia enorme também pode ser dividida: cada processo calcula a função estado -> estado
+# do seu pedaço (AfdCompilado.mapaDeTransicao) e as funções são compostas em ordem.
+import io
+import mmap
+import os
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+from multiprocessing.shared_memory import SharedMemory
+
+from main import AfdCompilado
+
+# Estado de cada processo trabalhador, preenchido por _iniciarTrabalhador
+_memoria = None
+_compilado = None
+
+
+def _iniciarTrabalhador(nome):
+    global _memoria, _compilado
+    _memoria = SharedMemory(name=nome)
+    _compilado = AfdCompilado.deBuffer(_memoria.buf, nome)
+    Finalize(None, _liberarTrabalhador, exitpriority=0)
+
+
+# As visões da tabela precisam sumir antes de fechar o bloco, senão close() falha na saída
+def _liberarTrabalhador():
+    global _compilado
+    _compilado = None
+    _memoria.close()
+
+
+def _aceitarLote(cadeias):
+    return _compilado.accepts_many(cadeias)
+
+
+def _mapaPedaco(pedaco):
+    return _compilado.mapaDeTransicao(pedaco)
+
+
+# O trabalhador lê sozinho o seu trecho do arquivo; só (caminho, início, fim) passa pelo pool
+def _mapaTrecho(trecho):
+    caminho, inicio, fim = trecho
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        return _compilado.mapaDeTransicao(mapa[inicio:fim])
+
+
+# Divide um iterável em listas de até "tamanho" itens, sem materializar a entrada inteira
+def dividirEmLotes(cadeias, tamanho):
+    iterador = iter(cadeias)
+    while lote := list(islice(iterador, tamanho)):
+        yield lote
+
+
+class AceitacaoParalela:
+    def __init__(self, afd, processos=None, tamanho_lote=10_000):
+        compilado = afd.compilar() if hasattr(afd, "compilar") else afd
+        dados = io.BytesIO()
+        compilado.salvarBinario(dados)
+        dados = dados.getbuffer()
+
+        self.compilado = compilado
+        self.tamanho_lote = tamanho_lote
+        self.processos = processos or os.cpu_count() or 1
+        self.memoria = SharedMemory(create=True, size=max(len(dados), 1))
+        self.memoria.buf[:len(dados)] = dados
+        self.pool = Pool(self.processos, initializer=_iniciarTrabalhador, initargs=(self.memoria.name,))
+
+    # Lista de aceitação na mesma ordem da entrada
+    def accepts_many(self, cadeias):
+        resultado = []
+        for parcial in self.pool.imap(_aceitarLote, dividirEmLotes(cadeias, self.tamanho_lote)):
+            resultado.extend(parcial)
+        return resultado
+
+    # Aceitação de uma única cadeia (str ou bytes) dividida em pedaços processados em paralelo
+    def accepts(self, cadeia, tamanho_pedaco=1 << 20):
+        pedacos = (cadeia[i:i + tamanho_pedaco] for i in range(0, len(cadeia), tamanho_pedaco))
+        return self.compor(self.pool.imap(_mapaPedaco, pedacos))
+
+    # O mesmo para o conteúdo de um arquivo (lido como bytes), sem carregá-lo no processo principal
+    def acceptsArquivo(self, caminho, tamanho_pedaco=1 << 24):
+        tamanho = os.path.getsize(caminho)
+        trechos = ((caminho, i, min(i + tamanho_pedaco, tamanho)) for i in range(0, tamanho, tamanho_pedaco))
+        return self.compor(self.pool.imap(_mapaTrecho, trechos))
+
+    # Compõe as funções dos pedaços a partir do estado inicial
+    def compor(self, mapas):
+        estado = self.compilado.inicial
+        for mapa in mapas:
+            estado = mapa[estado]
+        return self.compilado.finais[estado]
+
+    def fechar(self):
+        self.pool.close()
+        self.pool.join()
+        self.memoria.close()
+        self.memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+# Atalho para um uso só: cria o pool, processa e libera a memória compartilhada
+def accepts_many_paralelo(afd, cadeias, processos=None, tamanho_lote=10_000):
+    with AceitacaoParalela(afd, processos, tamanho_lote) as paralelo:
+        return paralelo.accepts_many(cadeias)
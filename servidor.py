@@ -0,0 +1,415 @@
+# Serviço asyncio de reconhecimento: um registro de AFDs nomeados, carregados e compilados uma única
+# vez a partir de arquivos .jff, atende vários clientes ao mesmo tempo por TCP local ou socket Unix.
+#
+# Protocolo: uma requisição JSON por linha e uma resposta JSON por linha, com o mesmo "id". As
+# requisições de uma conexão são atendidas concorrentemente, então as respostas podem chegar fora
+# de ordem. Respostas: {"id": ..., "ok": true, "resultado": ...} ou {"id": ..., "ok": false, "erro": "..."}.
+#
+#   {"id": 1, "op": "listar"}
+#   {"id": 2, "op": "aceitar", "afd": "par", "cadeia": "abba"}
+#   {"id": 3, "op": "aceitar_lote", "afd": "par", "cadeias": ["ab", "aab"]}
+#   {"id": 4, "op": "operacao", "operacao": "uniao", "operandos": ["par", "impar"], "destino": "todos"}
+#   {"id": 5, "op": "equivalentes", "afds": ["par", "todos"]}
+#   {"id": 6, "op": "estatisticas"}
+#
+# Cadeias curtas são respondidas direto no laço de eventos. Cadeias longas, lotes grandes, operações
+# entre AFDs e equivalências rodam num ProcessPoolExecutor, em paralelo de verdade (fora do GIL): as
+# tabelas compiladas ficam em memória compartilhada (formato de salvarBinario, como em paralelo.py) e
+# cada processo só recebe o nome do bloco, lendo a tabela uma vez. Um ThreadPoolExecutor cuida do
+# que é leve mas não deve travar o laço (resumos, registro de resultados, cache em disco).
+#
+# Uso: python servidor.py data/ --tcp 127.0.0.1:8765
+#      python servidor.py data/afd_xml.jff --unix /tmp/afd.sock
+import argparse
+import asyncio
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from cache import OPERACOES, CacheOperacoes
+from main import Afd, AfdCompilado
+
+# Acima desta quantidade de símbolos (somando o lote) a aceitação vai para o executor
+LIMITE_NO_LACO = 4096
+
+# Maior linha aceita (uma requisição) e máximo de requisições em andamento por conexão
+LIMITE_LINHA = 64 * 1024 * 1024
+EM_ANDAMENTO = 64
+
+# Tabelas guardadas por processo trabalhador antes de esvaziar o cache dele
+LIMITE_TABELAS = 64
+
+# Estado de cada processo trabalhador: nome do bloco de memória compartilhada -> AfdCompilado
+_tabelas = {}
+
+
+# A tabela é copiada para o processo e o bloco fechado logo em seguida: o registro pode trocá-lo
+# (e liberá-lo) sem esperar pelos trabalhadores
+def _tabela(bloco):
+    compilado = _tabelas.get(bloco)
+    if compilado is None:
+        memoria = SharedMemory(name=bloco)
+        try:
+            compilado = AfdCompilado.deBuffer(bytes(memoria.buf), bloco)
+        finally:
+            memoria.close()
+        if len(_tabelas) >= LIMITE_TABELAS:
+            _tabelas.clear()
+        _tabelas[bloco] = compilado
+    return compilado
+
+
+def _aceitar(bloco, cadeia):
+    return _tabela(bloco).accepts(cadeia)
+
+
+def _aceitarLote(bloco, cadeias):
+    return _tabela(bloco).accepts_many(cadeias)
+
+
+def _equivalentes(bloco_a, bloco_b):
+    return _tabela(bloco_a).paraAfd().verificarEquivalencia(_tabela(bloco_b).paraAfd())
+
+
+# O resultado volta compilado e com a assinatura calculada (ambas vão junto no pickle)
+def _operar(operacao, blocos):
+    resultado = OPERACOES[operacao][0](*(_tabela(bloco).paraAfd() for bloco in blocos))
+    resultado.assinatura()
+    return resultado
+
+
+class Registro:
+    def __init__(self):
+        self.afds = {}
+        self.blocos = {}  # nome -> SharedMemory com a tabela compilada, lida pelos processos
+
+    # Registra um AFD já montado: compila a tabela, calcula a assinatura (chave do cache de
+    # operações) e publica a tabela em memória compartilhada agora, não na primeira requisição
+    def registrar(self, nome, afd):
+        compilado = afd.compilar()
+        afd.assinatura()
+        dados = io.BytesIO()
+        compilado.salvarBinario(dados)
+        dados = dados.getbuffer()
+        bloco = SharedMemory(create=True, size=max(len(dados), 1))
+        bloco.buf[:len(dados)] = dados
+        del dados
+
+        antigo = self.blocos.get(nome)
+        self.afds[nome] = afd
+        self.blocos[nome] = bloco
+        if antigo is not None:
+            antigo.close()
+            antigo.unlink()
+        return afd
+
+    # Carrega um .jff (AFNs são determinizados e minimizados, como no menu)
+    def carregar(self, caminho, nome=None):
+        if nome is None:
+            nome = os.path.splitext(os.path.basename(caminho))[0]
+        try:
+            afd = Afd.carregarAFD(caminho)
+        except ValueError:
+            from afn import Afn
+            afd = Afn.carregarAFN(caminho).paraAfdMinimo()
+        return self.registrar(nome, afd)
+
+    # Carrega um arquivo ou todos os .jff de uma pasta
+    def carregarCaminho(self, caminho):
+        if os.path.isdir(caminho):
+            for arquivo in sorted(os.listdir(caminho)):
+                if arquivo.endswith(".jff"):
+                    self.carregar(os.path.join(caminho, arquivo))
+        else:
+            self.carregar(caminho)
+
+    def obter(self, nome):
+        afd = self.afds.get(nome)
+        if afd is None:
+            raise ValueError(f"AFD não registrado: {nome}")
+        return afd
+
+    # Nome do bloco de memória compartilhada do AFD (o que vai para os processos trabalhadores)
+    def bloco(self, nome):
+        self.obter(nome)
+        return self.blocos[nome].name
+
+    # Libera a memória compartilhada
+    def fechar(self):
+        for bloco in self.blocos.values():
+            bloco.close()
+            bloco.unlink()
+        self.blocos.clear()
+
+
+class ServidorAfd:
+    def __init__(self, registro, trabalhadores=None, cache=None):
+        self.registro = registro
+        # forkserver: os trabalhadores não herdam as threads (nem as travas) do servidor
+        self.processos = ProcessPoolExecutor(trabalhadores, mp_context=multiprocessing.get_context("forkserver"))
+        self.executor = ThreadPoolExecutor()
+        # O LRU do cache só é consultado e alterado no laço de eventos; threads só leem/gravam o disco
+        self.cache = cache if cache is not None else CacheOperacoes()
+        self.calculando = {}  # chave do cache -> tarefa em andamento (pedidos iguais esperam a mesma)
+        self.requisicoes = 0
+        self.erros = 0
+        self.conexoes = 0
+        self.servidor = None
+
+    async def iniciarTcp(self, host="127.0.0.1", porta=8765):
+        self.servidor = await asyncio.start_server(self.atender, host, porta, limit=LIMITE_LINHA)
+        return self.servidor
+
+    async def iniciarUnix(self, caminho):
+        self.servidor = await asyncio.start_unix_server(self.atender, caminho, limit=LIMITE_LINHA)
+        return self.servidor
+
+    async def fechar(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        self.executor.shutdown(wait=False)
+        self.processos.shutdown(wait=False, cancel_futures=True)
+
+    # Uma conexão: lê linhas e atende cada requisição numa tarefa própria
+    async def atender(self, leitor, escritor):
+        self.conexoes += 1
+        vagas = asyncio.Semaphore(EM_ANDAMENTO)
+        tarefas = set()
+        try:
+            while linha := await leitor.readline():
+                await vagas.acquire()
+                tarefa = asyncio.create_task(self.responder(linha, escritor, vagas))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            # A conexão caiu: ninguém vai ler as respostas pendentes
+            for tarefa in tarefas:
+                tarefa.cancel()
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        finally:
+            self.conexoes -= 1
+            escritor.close()
+
+    async def responder(self, linha, escritor, vagas):
+        identificador = None
+        try:
+            requisicao = json.loads(linha)
+            if not isinstance(requisicao, dict):
+                raise ValueError("A requisição deve ser um objeto JSON.")
+            identificador = requisicao.get("id")
+            resposta = {"id": identificador, "ok": True, "resultado": await self.executar(requisicao)}
+        except KeyError as erro:
+            self.erros += 1
+            resposta = {"id": identificador, "ok": False, "erro": f"Campo ausente: {erro.args[0]}"}
+        except (ValueError, TypeError) as erro:
+            self.erros += 1
+            resposta = {"id": identificador, "ok": False, "erro": str(erro)}
+        except Exception as erro:
+            # Qualquer outra falha (ex.: RecursionError num JSON muito aninhado) também vira uma
+            # resposta de erro, em vez de derrubar a tarefa sem responder
+            self.erros += 1
+            resposta = {"id": identificador, "ok": False, "erro": f"{type(erro).__name__}: {erro}"}
+        finally:
+            vagas.release()
+        self.requisicoes += 1
+        try:
+            escritor.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+            await escritor.drain()
+        except ConnectionError:
+            pass  # o cliente foi embora; atender encerra a conexão
+
+    async def executar(self, requisicao):
+        op = requisicao.get("op")
+        if op == "aceitar":
+            afd = self.registro.obter(requisicao["afd"])
+            cadeia = requisicao["cadeia"]
+            if len(cadeia) <= LIMITE_NO_LACO:
+                return afd.accepts(cadeia)
+            return await self.noProcesso(_aceitar, self.registro.bloco(requisicao["afd"]), cadeia)
+
+        if op == "aceitar_lote":
+            afd = self.registro.obter(requisicao["afd"])
+            cadeias = requisicao["cadeias"]
+            if sum(map(len, cadeias)) <= LIMITE_NO_LACO:
+                return afd.accepts_many(cadeias)
+            return await self.noProcesso(_aceitarLote, self.registro.bloco(requisicao["afd"]), cadeias)
+
+        if op == "operacao":
+            operacao = requisicao["operacao"]
+            if operacao not in OPERACOES:
+                raise ValueError(f"Operação desconhecida: {operacao}")
+            resultado = await self.operar(operacao, requisicao["operandos"])
+            resumo = await self.noExecutor(self.resumir, resultado)
+            destino = requisicao.get("destino")
+            if destino is not None:
+                # O mesmo objeto do cache: nem o registro nem o cache alteram os AFDs guardados
+                await self.noExecutor(self.registro.registrar, destino, resultado)
+            return {"destino": destino, **resumo}
+
+        if op == "equivalentes":
+            a, b = (self.registro.bloco(nome) for nome in requisicao["afds"])
+            return await self.noProcesso(_equivalentes, a, b)
+
+        if op == "listar":
+            return {nome: len(afd.estados) for nome, afd in self.registro.afds.items()}
+
+        if op == "estatisticas":
+            return {
+                "requisicoes": self.requisicoes,
+                "erros": self.erros,
+                "conexoes": self.conexoes,
+                "cache": self.cache.estatisticas(),
+            }
+
+        raise ValueError(f"Requisição desconhecida: {op}")
+
+    async def noExecutor(self, funcao, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, funcao, *argumentos)
+
+    async def noProcesso(self, funcao, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(self.processos, funcao, *argumentos)
+
+    # Resultado da operação (objeto guardado no cache). A chave usa as assinaturas já calculadas no
+    # registro; a consulta e a inserção no LRU acontecem no laço e o cálculo num processo
+    async def operar(self, operacao, nomes):
+        operandos = [self.registro.obter(nome) for nome in nomes]
+        blocos = [self.registro.bloco(nome) for nome in nomes]
+        chave = self.cache.chave(operacao, operandos)
+        resultado = self.cache.consultar(chave)
+        if resultado is not None:
+            return resultado
+
+        tarefa = self.calculando.get(chave)
+        if tarefa is None:
+            tarefa = asyncio.ensure_future(self.calcular(chave, operandos, operacao, blocos))
+            self.calculando[chave] = tarefa
+            tarefa.add_done_callback(lambda _: self.calculando.pop(chave, None))
+        # shield: quem desiste (conexão fechada) não cancela o cálculo dos outros que esperam
+        return await asyncio.shield(tarefa)
+
+    async def calcular(self, chave, operandos, operacao, blocos):
+        processos = self.processos
+
+        def aplicar():
+            return processos.submit(_operar, operacao, blocos).result()
+        calculado = await self.noExecutor(self.cache.calcular, chave, operandos, aplicar)
+        return self.cache.guardar(chave, *calculado)
+
+    # Roda no executor (a tabela e a assinatura já vêm prontas do processo ou do disco)
+    def resumir(self, resultado):
+        return {
+            "estados": len(resultado.estados),
+            "vazia": resultado.linguagemVazia(),
+            "assinatura": resultado.assinatura(),
+        }
+
+
+# Cliente assíncrono: várias requisições podem estar em andamento na mesma conexão; cada resposta
+# é entregue à requisição de mesmo id
+class ClienteAfd:
+    def __init__(self, leitor, escritor):
+        self.leitor = leitor
+        self.escritor = escritor
+        self.pendentes = {}
+        self.ids = itertools.count()
+        self.leitura = asyncio.create_task(self.lerRespostas())
+
+    # Endereço "host:porta" (TCP) ou "unix:/caminho"
+    @classmethod
+    async def conectar(cls, endereco):
+        if endereco.startswith("unix:"):
+            leitor, escritor = await asyncio.open_unix_connection(endereco[5:], limit=LIMITE_LINHA)
+        else:
+            host, porta = endereco.rsplit(":", 1)
+            leitor, escritor = await asyncio.open_connection(host, int(porta), limit=LIMITE_LINHA)
+        return cls(leitor, escritor)
+
+    async def lerRespostas(self):
+        try:
+            while linha := await self.leitor.readline():
+                resposta = json.loads(linha)
+                futuro = self.pendentes.pop(resposta.get("id"), None)
+                if futuro is not None and not futuro.done():
+                    futuro.set_result(resposta)
+        finally:
+            for futuro in self.pendentes.values():
+                if not futuro.done():
+                    futuro.set_exception(ConnectionError("Conexão encerrada pelo servidor."))
+            self.pendentes.clear()
+
+    # Envia a requisição e devolve o resultado (ValueError se o servidor responder com erro)
+    async def pedir(self, op, **campos):
+        identificador = next(self.ids)
+        futuro = asyncio.get_running_loop().create_future()
+        self.pendentes[identificador] = futuro
+        self.escritor.write(json.dumps({"id": identificador, "op": op, **campos}).encode("utf-8") + b"\n")
+        await self.escritor.drain()
+        resposta = await futuro
+        if not resposta["ok"]:
+            raise ValueError(resposta["erro"])
+        return resposta["resultado"]
+
+    async def aceitar(self, afd, cadeia):
+        return await self.pedir("aceitar", afd=afd, cadeia=cadeia)
+
+    async def aceitarLote(self, afd, cadeias):
+        return await self.pedir("aceitar_lote", afd=afd, cadeias=cadeias)
+
+    async def operacao(self, operacao, operandos, destino=None):
+        return await self.pedir("operacao", operacao=operacao, operandos=operandos, destino=destino)
+
+    async def fechar(self):
+        self.escritor.close()
+        try:
+            await self.escritor.wait_closed()
+        except ConnectionError:
+            pass
+        await self.leitura
+
+
+async def servir(caminhos, tcp=None, unix=None, trabalhadores=None):
+    registro = Registro()
+    for caminho in caminhos:
+        registro.carregarCaminho(caminho)
+    servidor = ServidorAfd(registro, trabalhadores)
+    if unix is not None:
+        await servidor.iniciarUnix(unix)
+        print(f"Servindo {len(registro.afds)} AFDs em unix:{unix}", flush=True)
+    else:
+        host, porta = (tcp or "127.0.0.1:8765").rsplit(":", 1)
+        await servidor.iniciarTcp(host, int(porta))
+        print(f"Servindo {len(registro.afds)} AFDs em {host}:{porta}", flush=True)
+    # SIGTERM encerra pelo mesmo caminho do Ctrl+C: a memória compartilhada e os processos são liberados
+    parar = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, parar.set)
+    try:
+        await parar.wait()
+    finally:
+        await servidor.fechar()
+        registro.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de reconhecimento de cadeias por AFDs")
+    parser.add_argument("caminhos", nargs="+", help="arquivos .jff ou pastas com arquivos .jff")
+    parser.add_argument("--tcp", help="host:porta (padrão 127.0.0.1:8765)")
+    parser.add_argument("--unix", help="caminho do socket Unix")
+    parser.add_argument("--trabalhadores", type=int, default=None, help="processos trabalhadores")
+    args = parser.parse_args()
+    try:
+        asyncio.run(servir(args.caminhos, args.tcp, args.unix, args.trabalhadores))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# Aceitação em lote com NumPy: bytes devem ser lidos como em Afd.accepts (caractere latin-1 de mesmo código)
+# Rodar da raiz do repositório: python -m pytest tests
+import pytest
+
+pytest.importorskip("numpy")
+
+from lote import LoteNumpy  # noqa: E402
+from main import Afd  # noqa: E402
+
+
+# Alterna entre par e ímpar a cada "a"; o símbolo de vários caracteres força o caminho geral de codificar
+def afdParidade(alfabeto):
+    afd = Afd(["p", "i"], alfabeto, "p", ["i"])
+    for simbolo in alfabeto:
+        afd.func_transicao[("p", simbolo)] = "i" if simbolo == "a" else "p"
+        afd.func_transicao[("i", simbolo)] = "p" if simbolo == "a" else "i"
+    return afd
+
+
+@pytest.mark.parametrize("alfabeto", [["a", "b"], ["a", "b", "bb"]])
+def test_bytes_como_accepts(alfabeto):
+    afd = afdParidade(alfabeto)
+    cadeias = [b"a", b"ab", bytearray(b"aba"), b"", b"ax", "a", "ba"]
+    esperado = [afd.accepts(cadeia) for cadeia in cadeias]
+    assert esperado == [True, True, False, False, False, True, True]
+    assert LoteNumpy(afd).aceitar(cadeias).tolist() == esperado
+    assert LoteNumpy(afd).aceitar([b"a"]).tolist() == [True]